@@ -1,18 +1,89 @@
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import functools
 import sys
-from dataclasses import asdict
+from typing import Optional
 
-from .config import load_llm_configs, load_full_config, create_default_config_file
+from .config import LLMConfig, load_full_config, create_default_config_file
+from .json_utils import dumps
 from .logging_utils import StepLogger
-from .llm_client import JsonLLMClient
-from .orchestrator import DeepSeekerOrchestrator
-from .search_client import SearchClient
+
+# Kept as a tuple (not a set) so `--help` lists choices in a stable order
+_WHEN_CHOICES = ("day", "week", "month", "year", "any")
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts where 0 switches a feature off."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {value}")
+    return number
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return number
+
+
+@functools.lru_cache(maxsize=None)
+def _get_search_client(extract_processes: int = 0):
+    """Return a process-wide SearchClient so its HTTP session is reused."""
+    from .search_client import SearchClient
+
+    return SearchClient(extract_processes=extract_processes)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_llm_cache(ttl_seconds: int):
+    """Return the shared on-disk LLM response cache."""
+    from .llm_cache import LLMCache
+
+    return LLMCache(ttl_seconds=ttl_seconds)
+
+
+# Responses kept in memory per client when --cache is on
+_MEMORY_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=None)
+def _get_llm_client(config: LLMConfig, api_key: Optional[str], base_url: Optional[str], cache=None):
+    """Return a shared JsonLLMClient per (model config, endpoint, cache)."""
+    from .llm_client import JsonLLMClient
+
+    # Response reuse is opt-in: both cache layers are only enabled with --cache
+    return JsonLLMClient(
+        config,
+        api_key=api_key,
+        base_url=base_url,
+        cache=cache,
+        memory_cache_size=_MEMORY_CACHE_SIZE if cache is not None else 0,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_semantic_cache():
+    """Return the shared paraphrase cache for LLM0 plans, persisted across runs."""
+    from .semantic_cache import DEFAULT_SEMANTIC_CACHE_PATH, SemanticCache
+
+    cache = SemanticCache(path=DEFAULT_SEMANTIC_CACHE_PATH)
+    # Load the embedding model while config, logging and the first search run
+    cache.warmup()
+    return cache
+
+
+def _llm_cache_from_args(args: argparse.Namespace):
+    """Return the response cache when --cache was given, else None."""
+    return _get_llm_cache(args.cache_ttl) if args.cache else None
 
 
 def cmd_search(args: argparse.Namespace) -> int:
+    from .types import SearchFilters, SearchRequest
+
     # Load config with optional config file
     config = load_full_config(args.config)
     
@@ -20,11 +91,9 @@ def cmd_search(args: argparse.Namespace) -> int:
     max_results = args.max_results if args.max_results is not None else config.search_max_results
     when = args.when if args.when is not None else config.search_freshness
     
-    search_client = SearchClient()
+    search_client = _get_search_client()
     logger = StepLogger(verbose=True, debug=args.debug)
 
-    from .types import SearchFilters, SearchRequest
-
     req = SearchRequest(
         query=args.query,
         when=when,
@@ -37,35 +106,71 @@ def cmd_search(args: argparse.Namespace) -> int:
         results = search_client.search(req)
     except Exception as e:
         logger.log("error", f"Search failed: {e}", error=True)
+        logger.close()
         return 1
 
     logger.log("search", f"Got {len(results)} results.")
-    print(json.dumps([r.__dict__ for r in results], ensure_ascii=False, indent=2))
+    logger.close()
+    # Emit the JSON array record by record instead of materializing one big string
+    write = sys.stdout.write
+    write("[")
+    for idx, r in enumerate(results):
+        write(",\n" if idx else "\n")
+        write(dumps(r, indent=True))
+    write("\n]\n" if results else "]\n")
     return 0
 
 
 def cmd_plan(args: argparse.Namespace) -> int:
-    from .llm_client import call_llm0_plan
+    from .llm_client import call_llm0_plan, call_llm0_plan_batch
 
     config = load_full_config(args.config)
     logger = StepLogger(verbose=True, debug=args.debug)
-    llm0 = JsonLLMClient(config.llm0, logger=logger, api_key=config.api_key, base_url=config.base_url)
+    cache = _llm_cache_from_args(args)
+    llm0 = _get_llm_client(config.llm0, config.api_key, config.base_url, cache)
+    llm0.logger = logger
+    if args.semantic_cache:
+        llm0.semantic_cache = _get_semantic_cache()
 
-    logger.log("plan", "Calling LLM0 planning endpoint.")
-    plan = call_llm0_plan(llm0, question=args.question)
-    print(json.dumps(asdict(plan), ensure_ascii=False, indent=2))
+    if args.questions_file:
+        with open(args.questions_file, encoding="utf-8") as f:
+            questions = [line.strip() for line in f if line.strip()]
+        if not questions:
+            logger.log("error", f"No questions found in {args.questions_file}.", error=True)
+            logger.close()
+            return 1
+
+        logger.log("plan", f"Calling LLM0 planning endpoint for {len(questions)} questions.")
+        plans = call_llm0_plan_batch(llm0, questions, max_workers=args.concurrency)
+        # One JSON object per line, in the order of the input file
+        for question, plan in zip(questions, plans):
+            if isinstance(plan, Exception):
+                logger.log("error", f"Planning failed for '{question}': {plan}", error=True)
+                print(dumps({"question": question, "error": str(plan)}))
+            else:
+                print(dumps({"question": question, "plan": plan}))
+    else:
+        logger.log("plan", "Calling LLM0 planning endpoint.")
+        plan = call_llm0_plan(llm0, question=args.question)
+        print(dumps(plan, indent=True))
     
     # Save log
     full_log_path = logger.save_full_log()
+    logger.close()
     print(f"\nLog saved to: {full_log_path}")
     return 0
 
 
 def cmd_run(args: argparse.Namespace) -> int:
+    from .orchestrator import DeepSeekerOrchestrator
+
     config = load_full_config(args.config)
-    llm0 = JsonLLMClient(config.llm0, api_key=config.api_key, base_url=config.base_url)
-    llm1 = JsonLLMClient(config.llm1, api_key=config.api_key, base_url=config.base_url)
-    search_client = SearchClient()
+    cache = _llm_cache_from_args(args)
+    llm0 = _get_llm_client(config.llm0, config.api_key, config.base_url, cache)
+    llm1 = _get_llm_client(config.llm1, config.api_key, config.base_url, cache)
+    if args.semantic_cache:
+        llm0.semantic_cache = _get_semantic_cache()
+    search_client = _get_search_client(args.extract_processes)
     logger = StepLogger(verbose=True, debug=args.debug)
 
     orchestrator = DeepSeekerOrchestrator(
@@ -73,9 +178,10 @@ def cmd_run(args: argparse.Namespace) -> int:
         llm1=llm1,
         search_client=search_client,
         logger=logger,
+        prefetch_top_k=args.prefetch_top_k,
     )
 
-    report = orchestrator.run(question=args.question)
+    report = asyncio.run(orchestrator.run_async(question=args.question))
 
     # Print human-readable summary + JSON
     if report.final_answer:
@@ -90,6 +196,7 @@ def cmd_run(args: argparse.Namespace) -> int:
     
     # Save full log with LLM I/O records
     full_log_path = logger.save_full_log()
+    logger.close()
     summary = logger.get_summary()
     
     print(f"\n===== SESSION SUMMARY =====")
@@ -98,6 +205,8 @@ def cmd_run(args: argparse.Namespace) -> int:
     print(f"Errors: {summary['errors']}")
     print(f"Full log saved to: {full_log_path}")
     print(f"Console log saved to: {summary['log_file']}")
+    if summary["llm_calls_file"]:
+        print(f"LLM calls log saved to: {summary['llm_calls_file']}")
     
     return 0
 
@@ -128,24 +237,21 @@ def cmd_init(args: argparse.Namespace) -> int:
         return 1
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(prog="deepseeker", description="DeepSeeker research CLI")
-    parser.add_argument("--debug", action="store_true", help="Enable DEBUG logging for detailed LLM I/O records")
-    parser.add_argument("--config", help="Path to JSON configuration file (default: config.json if exists)")
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
+def _add_init_parser(subparsers: argparse._SubParsersAction) -> None:
     # init - create config file
     p_init = subparsers.add_parser("init", help="Create a default configuration file.")
     p_init.add_argument("--output", default="config.json", help="Output path for config file.")
     p_init.set_defaults(func=cmd_init)
 
+
+def _add_search_parser(subparsers: argparse._SubParsersAction) -> None:
     # search
     p_search = subparsers.add_parser("search", help="Test BingSift search only.")
     p_search.add_argument("--query", required=True, help="Search query.")
     p_search.add_argument(
         "--when",
         default=None,
-        choices=["day", "week", "month", "year", "any"],
+        choices=_WHEN_CHOICES,
         help="Freshness filter for Bing search (overrides config).",
     )
     p_search.add_argument(
@@ -156,22 +262,109 @@ def main(argv: list[str] | None = None) -> int:
     )
     p_search.set_defaults(func=cmd_search)
 
+
+def _add_plan_parser(subparsers: argparse._SubParsersAction) -> None:
     # plan
     p_plan = subparsers.add_parser(
         "plan",
         help="Test LLM0 planning (direct answer vs. search).",
     )
-    p_plan.add_argument("--question", required=True, help="User research question.")
+    source = p_plan.add_mutually_exclusive_group(required=True)
+    source.add_argument("--question", help="User research question.")
+    source.add_argument(
+        "--questions-file",
+        help="Plan every question in this file (one per line); prints NDJSON.",
+    )
+    p_plan.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=4,
+        help="Maximum parallel LLM0 calls with --questions-file (default: 4).",
+    )
     p_plan.set_defaults(func=cmd_plan)
 
+
+def _add_run_parser(subparsers: argparse._SubParsersAction) -> None:
     # run
     p_run = subparsers.add_parser(
         "run",
         help="Run the full DeepSeeker pipeline for one question.",
     )
     p_run.add_argument("--question", required=True, help="User research question.")
+    p_run.add_argument(
+        "--prefetch-top-k",
+        type=_non_negative_int,
+        default=8,
+        help="Top-ranked pages fetched while LLM0 selects (default: 8, 0 disables).",
+    )
+    p_run.add_argument(
+        "--extract-processes",
+        type=_non_negative_int,
+        default=0,
+        help="Worker processes for page text extraction (default: 0, extract in threads).",
+    )
     p_run.set_defaults(func=cmd_run)
 
+
+_SUBCOMMANDS = {
+    "init": _add_init_parser,
+    "search": _add_search_parser,
+    "plan": _add_plan_parser,
+    "run": _add_run_parser,
+}
+
+
+# Global options that consume the following token as their value
+_GLOBAL_VALUE_OPTIONS = ("--config", "--cache-ttl")
+
+
+def _peek_command(argv: list[str]) -> str | None:
+    """Return the first positional token (the subcommand), skipping global options."""
+    skip_value = False
+    for token in argv:
+        if skip_value:
+            skip_value = False
+        elif token in _GLOBAL_VALUE_OPTIONS:
+            skip_value = True
+        elif not token.startswith("-"):
+            return token
+    return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(prog="deepseeker", description="DeepSeeker research CLI")
+    parser.add_argument("--debug", action="store_true", help="Also stream full LLM inputs/outputs to an NDJSON file per session")
+    parser.add_argument("--config", help="Path to JSON configuration file (default: config.json if exists)")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse identical LLM responses from ~/.deepseeker/cache.db",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=3600,
+        help="Lifetime of cached LLM responses in seconds (default: 3600)",
+    )
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Reuse LLM0 plans for paraphrased questions (needs deepseeker[semantic])",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Only build the subparser that will actually run; top-level --help and
+    # unknown commands still get the full list.
+    command = _peek_command(argv)
+    if command in _SUBCOMMANDS:
+        _SUBCOMMANDS[command](subparsers)
+    else:
+        for add_parser in _SUBCOMMANDS.values():
+            add_parser(subparsers)
+
     args = parser.parse_args(argv)
     return args.func(args)
 
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
-import json
+import functools
 import os
-from dataclasses import dataclass, asdict
+import types
+from dataclasses import dataclass
 from typing import Optional
 
+from .json_utils import dumps, loads
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LLMConfig:
     model: str
     max_output_tokens: int = 2048
+    # Send a per-call-type prompt_cache_key (OpenAI prompt caching); off by
+    # default because some OpenAI-compatible endpoints reject unknown fields
+    prompt_cache: bool = False
+    # Upper bound on page text sent in one summarization request
+    max_input_chars: int = 16000
+    # Constrain outputs with strict JSON schemas (response_format json_schema);
+    # requires a model/endpoint with structured-output support
+    structured_output: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DeepSeekerConfig:
     llm0: LLMConfig
     llm1: LLMConfig
@@ -22,6 +33,47 @@ class DeepSeekerConfig:
     search_freshness: str = "week"
 
 
+_DEFAULT_CONFIG = {
+    "api_key": "",  # Set your OpenAI API key here or use environment variable
+    "base_url": "",  # Optional: custom OpenAI-compatible endpoint
+    "llm0": {
+        "model": "gpt-5.1-thinking",
+        "max_output_tokens": 4096
+    },
+    "llm1": {
+        "model": "gpt-4o-mini",
+        "max_output_tokens": 1536
+    },
+    "search_max_results": 10,
+    "search_freshness": "week"
+}
+
+# The template never changes, so serialize it once at import time
+_DEFAULT_CONFIG_BYTES = dumps(_DEFAULT_CONFIG, indent=True).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _env() -> types.SimpleNamespace:
+    """
+    Snapshot the DeepSeeker environment variables, read once per process.
+    
+    Values are kept as raw strings; numbers are converted where they are
+    used, so a malformed variable only fails the path that needs it.
+    Call `_env.cache_clear()` to pick up changes made after the first load.
+    """
+    environ = os.environ
+    return types.SimpleNamespace(
+        api_key=environ.get("OPENAI_API_KEY"),
+        base_url=environ.get("OPENAI_BASE_URL"),
+        llm0_model=environ.get("DEEPSEEKER_LLM0_MODEL", "gpt-5.1-thinking"),
+        llm1_model=environ.get("DEEPSEEKER_LLM1_MODEL", "gpt-4o-mini"),
+        llm0_max_tokens=environ.get("DEEPSEEKER_LLM0_MAX_TOKENS", "4096"),
+        llm1_max_tokens=environ.get("DEEPSEEKER_LLM1_MAX_TOKENS", "1536"),
+        search_max_results=environ.get("DEEPSEEKER_SEARCH_MAX_RESULTS", "10"),
+        search_freshness=environ.get("DEEPSEEKER_SEARCH_FRESHNESS", "week"),
+    )
+
+
 def load_llm_configs(config_file: Optional[str] = None) -> tuple[LLMConfig, LLMConfig]:
     """
     Load LLM0 / LLM1 model names from config file or environment variables,
@@ -33,49 +85,10 @@ def load_llm_configs(config_file: Optional[str] = None) -> tuple[LLMConfig, LLMC
     3. Environment variables
     4. Default values
     """
-    # Priority 1: Explicit config file specified
-    if config_file:
-        if os.path.exists(config_file):
-            return _load_from_config_file(config_file)
-        else:
-            raise FileNotFoundError(f"Config file not found: {config_file}")
-    
-    # Priority 2: Default config.json in current directory
-    default_config_path = "config.json"
-    if os.path.exists(default_config_path):
-        return _load_from_config_file(default_config_path)
-    
-    # Priority 3: Environment variables
-    llm0_model = os.getenv("DEEPSEEKER_LLM0_MODEL", "gpt-5.1-thinking")
-    llm1_model = os.getenv("DEEPSEEKER_LLM1_MODEL", "gpt-4o-mini")
-    
-    llm0_max_tokens = int(os.getenv("DEEPSEEKER_LLM0_MAX_TOKENS", "4096"))
-    llm1_max_tokens = int(os.getenv("DEEPSEEKER_LLM1_MAX_TOKENS", "1536"))
-
-    llm0 = LLMConfig(model=llm0_model, max_output_tokens=llm0_max_tokens)
-    llm1 = LLMConfig(model=llm1_model, max_output_tokens=llm1_max_tokens)
-    return llm0, llm1
-
-
-def _load_from_config_file(config_file: str) -> tuple[LLMConfig, LLMConfig]:
-    """Load configuration from a JSON config file."""
-    with open(config_file, 'r', encoding='utf-8') as f:
-        config_data = json.load(f)
-    
-    llm0_data = config_data.get("llm0", {})
-    llm1_data = config_data.get("llm1", {})
-    
-    llm0 = LLMConfig(
-        model=llm0_data.get("model", "gpt-5.1-thinking"),
-        max_output_tokens=llm0_data.get("max_output_tokens", 4096)
-    )
-    
-    llm1 = LLMConfig(
-        model=llm1_data.get("model", "gpt-4o-mini"),
-        max_output_tokens=llm1_data.get("max_output_tokens", 1536)
-    )
-    
-    return llm0, llm1
+    config_data = _find_config_data(config_file)
+    if config_data is not None:
+        return _llm_configs_from_dict(config_data)
+    return _llm_configs_from_env()
 
 
 def load_full_config(config_file: Optional[str] = None) -> DeepSeekerConfig:
@@ -88,53 +101,112 @@ def load_full_config(config_file: Optional[str] = None) -> DeepSeekerConfig:
     3. Environment variables
     4. Default values
     """
-    llm0, llm1 = load_llm_configs(config_file)
-    
-    # Determine which config file to use for additional settings
-    config_path = None
-    if config_file and os.path.exists(config_file):
-        config_path = config_file
-    elif os.path.exists("config.json"):
-        config_path = "config.json"
-    
-    # Try config file for additional settings
-    if config_path:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
-        
-        # Get API settings from config file
-        api_key = config_data.get("api_key")
-        base_url = config_data.get("base_url")
-        
-        # If not in config file, try environment variables
-        if api_key is None:
-            api_key = os.getenv("OPENAI_API_KEY")
-        if base_url is None:
-            base_url = os.getenv("OPENAI_BASE_URL")
-        
+    config_data = _find_config_data(config_file)
+    
+    # Use environment variables or defaults
+    if config_data is None:
+        env = _env()
+        llm0, llm1 = _llm_configs_from_env()
         return DeepSeekerConfig(
             llm0=llm0,
             llm1=llm1,
-            api_key=api_key,
-            base_url=base_url,
-            search_max_results=config_data.get("search_max_results", 10),
-            search_freshness=config_data.get("search_freshness", "week")
+            api_key=env.api_key,
+            base_url=env.base_url,
+            search_max_results=int(env.search_max_results),
+            search_freshness=env.search_freshness
         )
     
-    # Use environment variables or defaults
-    api_key = os.getenv("OPENAI_API_KEY")
-    base_url = os.getenv("OPENAI_BASE_URL")
-    search_max_results = int(os.getenv("DEEPSEEKER_SEARCH_MAX_RESULTS", "10"))
-    search_freshness = os.getenv("DEEPSEEKER_SEARCH_FRESHNESS", "week")
+    llm0, llm1 = _llm_configs_from_dict(config_data)
+    
+    # Get API settings from config file
+    api_key = config_data.get("api_key")
+    base_url = config_data.get("base_url")
+    
+    # If not in config file, try environment variables
+    if api_key is None:
+        api_key = _env().api_key
+    if base_url is None:
+        base_url = _env().base_url
     
     return DeepSeekerConfig(
         llm0=llm0,
         llm1=llm1,
         api_key=api_key,
         base_url=base_url,
-        search_max_results=search_max_results,
-        search_freshness=search_freshness
+        search_max_results=config_data.get("search_max_results", 10),
+        search_freshness=config_data.get("search_freshness", "week")
+    )
+
+
+def _find_config_data(config_file: Optional[str]) -> Optional[dict]:
+    """
+    Locate and parse the active config file.
+    
+    Returns None when no file was specified and there is no config.json in
+    the current directory; raises FileNotFoundError for a missing --config.
+    """
+    # Priority 1: Explicit config file specified
+    if config_file:
+        try:
+            return _read_config_file(config_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_file}") from None
+    
+    # Priority 2: Default config.json in current directory
+    try:
+        return _read_config_file("config.json")
+    except FileNotFoundError:
+        return None
+
+
+def _read_config_file(config_file: str) -> dict:
+    """
+    Read and parse a JSON config file.
+    
+    The parsed dict is cached per (path, mtime, size), so repeated loads in
+    one process skip the file read while edits still invalidate the cache.
+    Callers must treat the returned dict as read-only.
+    """
+    st = os.stat(config_file)
+    return _parse_config_file(os.path.abspath(config_file), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> dict:
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def _llm_configs_from_dict(config_data: dict) -> tuple[LLMConfig, LLMConfig]:
+    """Build LLM configs from a parsed config file."""
+    llm0_data = config_data.get("llm0", {})
+    llm1_data = config_data.get("llm1", {})
+    
+    llm0 = LLMConfig(
+        model=llm0_data.get("model", "gpt-5.1-thinking"),
+        max_output_tokens=llm0_data.get("max_output_tokens", 4096),
+        prompt_cache=llm0_data.get("prompt_cache", False),
+        max_input_chars=llm0_data.get("max_input_chars", 16000),
+        structured_output=llm0_data.get("structured_output", False)
+    )
+    
+    llm1 = LLMConfig(
+        model=llm1_data.get("model", "gpt-4o-mini"),
+        max_output_tokens=llm1_data.get("max_output_tokens", 1536),
+        prompt_cache=llm1_data.get("prompt_cache", False),
+        max_input_chars=llm1_data.get("max_input_chars", 16000),
+        structured_output=llm1_data.get("structured_output", False)
     )
+    
+    return llm0, llm1
+
+
+def _llm_configs_from_env() -> tuple[LLMConfig, LLMConfig]:
+    """Build LLM configs from environment variables and defaults."""
+    env = _env()
+    llm0 = LLMConfig(model=env.llm0_model, max_output_tokens=int(env.llm0_max_tokens))
+    llm1 = LLMConfig(model=env.llm1_model, max_output_tokens=int(env.llm1_max_tokens))
+    return llm0, llm1
 
 
 def create_default_config_file(file_path: str = "config.json") -> str:
@@ -144,23 +216,8 @@ def create_default_config_file(file_path: str = "config.json") -> str:
     Returns:
         Path to the created config file.
     """
-    default_config = {
-        "api_key": "",  # Set your OpenAI API key here or use environment variable
-        "base_url": "",  # Optional: custom OpenAI-compatible endpoint
-        "llm0": {
-            "model": "gpt-5.1-thinking",
-            "max_output_tokens": 4096
-        },
-        "llm1": {
-            "model": "gpt-4o-mini",
-            "max_output_tokens": 1536
-        },
-        "search_max_results": 10,
-        "search_freshness": "week"
-    }
-    
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(default_config, f, indent=2, ensure_ascii=False)
+    with open(file_path, 'wb') as f:
+        f.write(_DEFAULT_CONFIG_BYTES)
     
     return file_path
 
@@ -174,15 +231,21 @@ def save_config_to_file(config: DeepSeekerConfig, file_path: str) -> None:
         "base_url": config.base_url if config.base_url else "",
         "llm0": {
             "model": config.llm0.model,
-            "max_output_tokens": config.llm0.max_output_tokens
+            "max_output_tokens": config.llm0.max_output_tokens,
+            "prompt_cache": config.llm0.prompt_cache,
+            "max_input_chars": config.llm0.max_input_chars,
+            "structured_output": config.llm0.structured_output
         },
         "llm1": {
             "model": config.llm1.model,
-            "max_output_tokens": config.llm1.max_output_tokens
+            "max_output_tokens": config.llm1.max_output_tokens,
+            "prompt_cache": config.llm1.prompt_cache,
+            "max_input_chars": config.llm1.max_input_chars,
+            "structured_output": config.llm1.structured_output
         },
         "search_max_results": config.search_max_results,
         "search_freshness": config.search_freshness
     }
     
     with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(config_dict, f, indent=2, ensure_ascii=False)
+        f.write(dumps(config_dict, indent=True))
@@ -0,0 +1,78 @@
+"""
+JSON Utilities
+Serializes with orjson when it is installed, falling back to the stdlib json module.
+"""
+from __future__ import annotations
+
+import functools
+import json
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Optional, Tuple, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional speedup
+    orjson = None
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Field names of a dataclass type, resolved once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _stdlib_default(fallback: Optional[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Build a stdlib `default` hook with shallow dataclass -> dict conversion."""
+    def default(obj: Any) -> Any:
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return {name: getattr(obj, name) for name in _field_names(type(obj))}
+        if fallback is not None:
+            return fallback(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return default
+
+
+def dumps(
+    obj: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Serialize an object to a JSON string, keeping non-ASCII characters as-is.
+
+    Dataclass instances are serialized field by field without the deep copy
+    that dataclasses.asdict performs (orjson handles them natively).
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation
+        default: Fallback for otherwise unsupported objects (e.g. `str`)
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        # Non-str keys are stringified, as json.dumps does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        default=_stdlib_default(default),
+    )
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or UTF-8 encoded bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
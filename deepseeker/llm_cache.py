@@ -0,0 +1,92 @@
+"""
+LLM Response Cache
+Exact-match, on-disk cache for JSON LLM responses, backed by SQLite with a TTL.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .json_utils import dumps, loads
+
+DEFAULT_CACHE_PATH = os.path.join("~", ".deepseeker", "cache.db")
+
+
+class LLMCache:
+    """
+    Stores parsed LLM responses keyed by a BLAKE2b hash of the request.
+
+    Only exact repeats hit the cache (same endpoint, model, token limit,
+    response format and messages),
+    which makes it most useful while iterating on the same question during
+    development. Entries older than `ttl_seconds` are treated as misses.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: int = 3600):
+        self.path = os.path.expanduser(path)
+        self.ttl_seconds = ttl_seconds
+
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+        # One connection shared by all callers; the lock serializes access
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        max_tokens: int,
+        messages: List[Dict[str, Any]],
+        response_format: Optional[Dict[str, Any]] = None,
+        base_url: Optional[str] = None,
+    ) -> str:
+        """
+        Hash the request parameters that determine the response.
+
+        Summaries embed whole page excerpts, so the fast BLAKE2b digest keeps
+        keying cheap while still yielding a short fixed-size key.
+        """
+        payload = dumps({
+            "base_url": base_url,
+            "model": model,
+            "max_tokens": max_tokens,
+            "response_format": response_format,
+            "messages": messages,
+        })
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response, or None on a miss or expired entry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return loads(row[0])
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response with the configured TTL."""
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, dumps(value).encode("utf-8"), expires_at),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
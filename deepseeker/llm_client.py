@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-import json
+import functools
 import os
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from .config import LLMConfig
+from .json_utils import dumps, loads
+from .llm_cache import LLMCache
+from .llm_schemas import RESPONSE_SCHEMAS
 from .logging_utils import StepLogger
+from .semantic_cache import SemanticCache
 from .types import (
     ArticleSummary,
     FinalAnswer,
@@ -20,6 +29,76 @@ from .types import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_openai_client(api_key: Optional[str], base_url: Optional[str]) -> OpenAI:
+    """
+    One OpenAI client (and so one HTTP connection pool) per endpoint.
+
+    LLM0 and LLM1 usually talk to the same endpoint with different models,
+    so sharing the client lets them reuse warm keep-alive connections.
+    """
+    if base_url:
+        return OpenAI(api_key=api_key, base_url=base_url)
+    return OpenAI(api_key=api_key)
+
+
+_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+
+def _matching_brace(text: str, start: int) -> int:
+    """Index of the '}' closing the '{' at `start`, or -1; skips braces inside strings."""
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def _parse_json_object(content: str) -> Dict[str, Any]:
+    """
+    Decode the model's JSON reply.
+
+    JSON mode normally yields a bare object, which is decoded directly. Some
+    OpenAI-compatible endpoints still wrap it in a code fence or prose; then
+    the first balanced {...} is cut out with one linear scan and decoded.
+    """
+    try:
+        return loads(content)
+    except ValueError:
+        start = content.find("{")
+        end = _matching_brace(content, start) if start != -1 else -1
+        if end == -1:
+            raise
+        return loads(content[start:end + 1])
+
+
+def _response_format(call_type: str, structured_output: bool) -> Dict[str, Any]:
+    """Use strict json_schema mode when enabled and a schema exists for the call type."""
+    schema = RESPONSE_SCHEMAS.get(call_type) if structured_output else None
+    if schema is None:
+        return _JSON_OBJECT_FORMAT
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": call_type, "schema": schema, "strict": True},
+    }
+
+
 class JsonLLMClient:
     """
     Small helper around OpenAI-style chat completion API that always expects
@@ -29,67 +108,249 @@ class JsonLLMClient:
     """
 
     def __init__(self, config: LLMConfig, client: OpenAI | None = None, logger: Optional[StepLogger] = None, 
-                 api_key: Optional[str] = None, base_url: Optional[str] = None):
+                 api_key: Optional[str] = None, base_url: Optional[str] = None,
+                 cache: Optional[LLMCache] = None, memory_cache_size: int = 0,
+                 semantic_cache: Optional[SemanticCache] = None,
+                 async_client: AsyncOpenAI | None = None):
         self.config = config
         self.logger = logger
+        self.cache = cache
+        # Optional paraphrase-level cache used by call_llm0_plan
+        self.semantic_cache = semantic_cache
+        # AsyncOpenAI for achat_json, created on first use (see aclose)
+        self._async_client = async_client
+
+        # In-process LRU of parsed responses, checked before the on-disk cache;
+        # off by default (0) since sampled responses are not deterministic
+        self.memory_cache_size = memory_cache_size
+        self._memory_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
         
+        # Priority: explicit parameters > environment variables
+        self._api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self._base_url = base_url or os.getenv("OPENAI_BASE_URL")
+
         if client is not None:
             self.client = client
         else:
-            # Priority: explicit parameters > environment variables
-            use_api_key = api_key or os.getenv("OPENAI_API_KEY")
-            use_base_url = base_url or os.getenv("OPENAI_BASE_URL")
-            
-            if use_base_url:
-                self.client = OpenAI(api_key=use_api_key, base_url=use_base_url)
-            else:
-                self.client = OpenAI(api_key=use_api_key)
+            self.client = _shared_openai_client(self._api_key, self._base_url)
 
     def chat_json(self, messages: List[Dict[str, Any]], call_type: str = "unknown") -> Dict[str, Any]:
         """Make LLM call with full logging of input/output."""
         start_time = time.time()
+
+        cache_key, cached = self._cached_response(messages, call_type)
+        if cached is not None:
+            return cached
         
         try:
-            resp = self.client.chat.completions.create(
+            resp = self.client.chat.completions.create(**self._request_kwargs(messages, call_type))
+            return self._finish_call(resp.choices[0].message.content, messages, call_type, cache_key, start_time)
+        except Exception as e:
+            self._log_failed_call(messages, call_type, e, start_time)
+            raise
+
+    def stream_json(
+        self,
+        messages: List[Dict[str, Any]],
+        call_type: str = "unknown",
+        on_delta: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Like `chat_json`, but streams the completion.
+
+        `on_delta` receives each content fragment as it arrives, so callers can
+        show long outputs progressively; the parsed JSON object is returned once
+        the stream ends. Cache hits return immediately without any deltas.
+        """
+        start_time = time.time()
+
+        cache_key, cached = self._cached_response(messages, call_type)
+        if cached is not None:
+            return cached
+
+        try:
+            parts: List[str] = []
+            stream = self.client.chat.completions.create(
+                stream=True, **self._request_kwargs(messages, call_type)
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    if on_delta is not None:
+                        on_delta(delta)
+            content = "".join(parts) if parts else None
+            return self._finish_call(content, messages, call_type, cache_key, start_time)
+        except Exception as e:
+            self._log_failed_call(messages, call_type, e, start_time)
+            raise
+
+    async def achat_json(self, messages: List[Dict[str, Any]], call_type: str = "unknown") -> Dict[str, Any]:
+        """Async variant of `chat_json` using a shared AsyncOpenAI client."""
+        start_time = time.time()
+
+        cache_key, cached = self._cached_response(messages, call_type)
+        if cached is not None:
+            return cached
+
+        try:
+            resp = await self._get_async_client().chat.completions.create(**self._request_kwargs(messages, call_type))
+            return self._finish_call(resp.choices[0].message.content, messages, call_type, cache_key, start_time)
+        except Exception as e:
+            self._log_failed_call(messages, call_type, e, start_time)
+            raise
+
+    def _request_kwargs(self, messages: List[Dict[str, Any]], call_type: str) -> Dict[str, Any]:
+        """Arguments for chat.completions.create shared by the sync and async paths."""
+        kwargs: Dict[str, Any] = {
+            "model": self.config.model,
+            "messages": messages,
+            "max_tokens": self.config.max_output_tokens,
+            "response_format": _response_format(call_type, self.config.structured_output),
+        }
+        if self.config.prompt_cache:
+            # The system prompt is a fixed prefix per call type, so routing each
+            # call type to the same cache key maximizes provider-side prefix hits
+            kwargs["extra_body"] = {"prompt_cache_key": f"deepseeker:{call_type}"}
+        return kwargs
+
+    async def aclose(self) -> None:
+        """
+        Close the async client's connection pool.
+
+        Its connections belong to the running event loop, so call this before
+        the loop ends; a new client is created on the next `achat_json`.
+        """
+        if self._async_client is not None:
+            client, self._async_client = self._async_client, None
+            await client.close()
+
+    async def __aenter__(self) -> "JsonLLMClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        if self._async_client is None:
+            if self._base_url:
+                self._async_client = AsyncOpenAI(api_key=self._api_key, base_url=self._base_url)
+            else:
+                self._async_client = AsyncOpenAI(api_key=self._api_key)
+        return self._async_client
+
+    def _cached_response(
+        self, messages: List[Dict[str, Any]], call_type: str
+    ) -> tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (cache_key, cached_response); both are None when caching is off."""
+        if self.memory_cache_size <= 0 and self.cache is None:
+            return None, None
+
+        cache_key = LLMCache.make_key(
+            self.config.model,
+            self.config.max_output_tokens,
+            messages,
+            response_format=_response_format(call_type, self.config.structured_output),
+            base_url=self._base_url,
+        )
+        cached = self._cache_lookup(cache_key)
+        if cached is not None and self.logger:
+            self.logger.log_llm_call(
+                call_type=f"{call_type} (cached)",
+                messages=messages,
+                response=cached,
                 model=self.config.model,
+                duration_ms=0,
+            )
+        return cache_key, cached
+
+    def _finish_call(
+        self,
+        content: Optional[str],
+        messages: List[Dict[str, Any]],
+        call_type: str,
+        cache_key: Optional[str],
+        start_time: float,
+    ) -> Dict[str, Any]:
+        """Parse completion content, store it in the caches and log the call."""
+        duration_ms = int((time.time() - start_time) * 1000)
+        
+        if content is None:
+            raise RuntimeError("LLM returned empty content")
+        
+        # Parse response
+        response_data = _parse_json_object(content)
+        if cache_key is not None:
+            self._cache_store(cache_key, response_data)
+        
+        # Log the full call if logger is available
+        if self.logger:
+            self.logger.log_llm_call(
+                call_type=call_type,
                 messages=messages,
-                max_tokens=self.config.max_output_tokens,
-                response_format={"type": "json_object"},
+                response=response_data,
+                model=self.config.model,
+                duration_ms=duration_ms,
             )
-            
+        
+        return response_data
+
+    def _log_failed_call(
+        self,
+        messages: List[Dict[str, Any]],
+        call_type: str,
+        error: Exception,
+        start_time: float,
+    ) -> None:
+        # Log error details
+        if self.logger:
             duration_ms = int((time.time() - start_time) * 1000)
-            content = resp.choices[0].message.content
-            
-            if content is None:
-                raise RuntimeError("LLM returned empty content")
-            
-            # Parse response
-            response_data = json.loads(content)
-            
-            # Log the full call if logger is available
-            if self.logger:
-                self.logger.log_llm_call(
-                    call_type=call_type,
-                    messages=messages,
-                    response=response_data,
-                    model=self.config.model,
-                    duration_ms=duration_ms,
-                )
-            
-            return response_data
-            
-        except Exception as e:
-            # Log error details
-            if self.logger:
-                duration_ms = int((time.time() - start_time) * 1000)
-                self.logger.log_llm_call(
-                    call_type=call_type,
-                    messages=messages,
-                    response={"error": str(e)},
-                    model=self.config.model,
-                    duration_ms=duration_ms,
-                )
-            raise
+            self.logger.log_llm_call(
+                call_type=call_type,
+                messages=messages,
+                response={"error": str(error)},
+                model=self.config.model,
+                duration_ms=duration_ms,
+            )
+
+    def _cache_lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response from memory or disk, updating hit/miss stats."""
+        with self._memory_lock:
+            cached = self._memory_cache.get(key)
+            if cached is not None:
+                self._memory_cache.move_to_end(key)
+                self.stats["hits"] += 1
+                return cached
+
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._remember(key, cached)
+                with self._memory_lock:
+                    self.stats["hits"] += 1
+                return cached
+
+        with self._memory_lock:
+            self.stats["misses"] += 1
+        return None
+
+    def _cache_store(self, key: str, response: Dict[str, Any]) -> None:
+        self._remember(key, response)
+        if self.cache is not None:
+            self.cache.set(key, response)
+
+    def _remember(self, key: str, response: Dict[str, Any]) -> None:
+        if self.memory_cache_size <= 0:
+            return
+        with self._memory_lock:
+            self._memory_cache[key] = response
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > self.memory_cache_size:
+                self._memory_cache.popitem(last=False)
 
 
 # ---------- LLM0 prompts & helpers ----------
@@ -138,31 +399,87 @@ Guidance about multiple searches:
 - Keep queries reasonably specific, not too broad or too narrow.
 - Use English for queries and filters.
 """.strip()
+# Built once and shared by every call of this type; treat as read-only
+_SYSTEM_MESSAGE_PLAN = {"role": "system", "content": LLM0_SYSTEM_PROMPT_PLAN}
+
+
+# Questions about the last day or so always need a fresh search, so planning
+# them with LLM0 would only cost a round-trip. Only phrases that cannot mean
+# anything but "recent" qualify: bare words such as "today" or "breaking"
+# also appear in ordinary questions ("breaking changes in Python 3.12"), and
+# anything broader ("latest", "news") still goes through the planner.
+_FORCE_SEARCH = re.compile(
+    r"\b(breaking news|today['’]s news|today['’]s headlines|as of today|"
+    r"earlier today|so far today|in the (?:last|past) 24 hours)\b",
+    re.IGNORECASE,
+).search
+
+
+def _plan_from_dict(data: Dict[str, Any]) -> PlanDecision:
+    """Rebuild a PlanDecision stored as a plain dict in the semantic cache."""
+    return PlanDecision(
+        action=data["action"],
+        direct_answer=data.get("direct_answer"),
+        search_requests=[
+            SearchRequest(
+                query=s["query"],
+                when=s["when"],
+                filters=SearchFilters(**s["filters"]),
+                max_results=s["max_results"],
+            )
+            for s in data.get("search_requests", [])
+        ],
+        notes=data.get("notes"),
+    )
 
 
 def call_llm0_plan(llm: JsonLLMClient, question: str) -> PlanDecision:
+    if llm.semantic_cache is not None:
+        cached = llm.semantic_cache.get(question)
+        if cached is not None:
+            # Stored as a dict so a persisted index can hold it; each hit gets
+            # its own PlanDecision, which callers may mutate
+            return _plan_from_dict(cached)
+
+    if _FORCE_SEARCH(question):
+        return PlanDecision(
+            action="search_then_answer",
+            search_requests=[
+                SearchRequest(query=question, when="day", filters=SearchFilters(), max_results=10)
+            ],
+            notes="Question refers to the last day; searching without an LLM0 planning call.",
+        )
+
+    plan = _call_llm0_plan(llm, question)
+    if llm.semantic_cache is not None:
+        llm.semantic_cache.add(question, asdict(plan))
+    return plan
+
+
+def _call_llm0_plan(llm: JsonLLMClient, question: str) -> PlanDecision:
     messages = [
-        {"role": "system", "content": LLM0_SYSTEM_PROMPT_PLAN},
+        _SYSTEM_MESSAGE_PLAN,
         {
             "role": "user",
-            "content": json.dumps({"question": question}, ensure_ascii=False),
+            "content": dumps({"question": question}),
         },
     ]
     data = llm.chat_json(messages, call_type="llm0_plan")
-    action = data.get("action")
-    notes = data.get("notes")
+    get = data.get
+    action = get("action")
+    notes = get("notes")
 
     # --- direct_answer path ---
     if action == "direct_answer":
         return PlanDecision(
             action=action,
-            direct_answer=data.get("direct_answer", ""),
+            direct_answer=get("direct_answer", ""),
             notes=notes,
         )
 
     # --- search_then_answer path (multi-search) ---
     if action == "search_then_answer":
-        raw_searches = data.get("searches") or []
+        raw_searches = get("searches") or []
 
         # backward compatibility: allow a single "search" object
         if not raw_searches and "search" in data:
@@ -212,6 +529,31 @@ def call_llm0_plan(llm: JsonLLMClient, question: str) -> PlanDecision:
     )
 
 
+def call_llm0_plan_batch(
+    llm: JsonLLMClient,
+    questions: List[str],
+    max_workers: int = 4,
+) -> List[Union[PlanDecision, Exception]]:
+    """
+    Plan several independent questions concurrently with a bounded thread pool.
+
+    Returns one entry per question, in input order: the PlanDecision, or the
+    exception raised for that question.
+    """
+    if not questions:
+        return []
+
+    workers = max(1, min(max_workers, len(questions)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(call_llm0_plan, llm, q) for q in questions]
+
+    results: List[Union[PlanDecision, Exception]] = []
+    for future in futures:
+        exc = future.exception()
+        results.append(exc if exc is not None else future.result())
+    return results
+
+
 LLM0_SYSTEM_PROMPT_SELECT = """
 You are LLM0 inside DeepSeeker.
 
@@ -233,6 +575,7 @@ Guidelines:
 - Avoid obvious duplicates.
 - If all results are weak, you may return an empty list but explain why.
 """.strip()
+_SYSTEM_MESSAGE_SELECT = {"role": "system", "content": LLM0_SYSTEM_PROMPT_SELECT}
 
 
 def call_llm0_select(
@@ -249,18 +592,16 @@ def call_llm0_select(
         for r in search_results
     ]
     messages = [
-        {"role": "system", "content": LLM0_SYSTEM_PROMPT_SELECT},
+        _SYSTEM_MESSAGE_SELECT,
         {
             "role": "user",
-            "content": json.dumps(
-                {"question": question, "results": results_payload},
-                ensure_ascii=False,
-            ),
+            "content": dumps({"question": question, "results": results_payload}),
         },
     ]
     data = llm.chat_json(messages, call_type="llm0_select")
-    selected_ids = data.get("selected_ids") or []
-    notes = data.get("notes")
+    get = data.get
+    selected_ids = get("selected_ids") or []
+    notes = get("notes")
     return SelectionDecision(selected_ids=selected_ids, notes=notes)
 
 
@@ -269,8 +610,9 @@ You are LLM0 inside DeepSeeker.
 
 You receive:
 - The original research question.
-- A list of search results.
-- A list of article summaries produced by LLM1.
+- A list of search results (id, title, url, snippet, ...).
+- A list of article summaries produced by LLM1. Each summary refers to its
+  source through "result_id", which matches the "id" of a search result.
 
 Your job is to write a structured, well-organized final answer.
 
@@ -287,6 +629,12 @@ Output a JSON object with this structure:
 - Explicitly integrate information from multiple sources.
 - Mention limitations when evidence is weak or conflicting.
 """.strip()
+_SYSTEM_MESSAGE_SYNTHESIZE = {"role": "system", "content": LLM0_SYSTEM_PROMPT_SYNTHESIZE}
+
+
+def _drop_empty(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Remove None / empty-string / empty-list values from a payload row."""
+    return {k: v for k, v in row.items() if v is not None and v != "" and v != []}
 
 
 def call_llm0_synthesize(
@@ -294,49 +642,60 @@ def call_llm0_synthesize(
     question: str,
     search_results: list[SearchResult],
     summaries: list[ArticleSummary],
+    on_delta: Optional[Callable[[str], None]] = None,
 ) -> FinalAnswer:
+    """
+    Ask LLM0 for the final report.
+
+    The (long) completion is streamed; pass `on_delta` to receive the raw
+    JSON text fragments as they are generated.
+    """
+    # Summaries point at their search result by id instead of repeating its
+    # url/title, and empty fields are dropped, to keep the prompt small
     results_payload = [
-        {
-            "id": r.id,
-            "title": r.title,
-            "url": r.url,
-            "snippet": r.snippet,
-            "domain": r.domain,
-            "guessed_time": r.guessed_time,
-        }
+        _drop_empty(
+            {
+                "id": r.id,
+                "title": r.title,
+                "url": r.url,
+                "snippet": r.snippet,
+                "domain": r.domain,
+                "guessed_time": r.guessed_time,
+            }
+        )
         for r in search_results
     ]
     summaries_payload = [
-        {
-            "result_id": s.result_id,
-            "url": s.url,
-            "title": s.title,
-            "summary": s.summary,
-            "key_points": s.key_points,
-            "relevance_score": s.relevance_score,
-        }
+        _drop_empty(
+            {
+                "result_id": s.result_id,
+                "summary": s.summary,
+                "key_points": s.key_points,
+                "relevance_score": s.relevance_score,
+            }
+        )
         for s in summaries
     ]
 
     messages = [
-        {"role": "system", "content": LLM0_SYSTEM_PROMPT_SYNTHESIZE},
+        _SYSTEM_MESSAGE_SYNTHESIZE,
         {
             "role": "user",
-            "content": json.dumps(
+            "content": dumps(
                 {
                     "question": question,
                     "search_results": results_payload,
                     "summaries": summaries_payload,
-                },
-                ensure_ascii=False,
+                }
             ),
         },
     ]
-    data = llm.chat_json(messages, call_type="llm0_synthesize")
-    answer = data.get("answer", "")
-    key_points = data.get("key_points") or []
-    used_results = data.get("used_results") or []
-    notes = data.get("notes")
+    data = llm.stream_json(messages, call_type="llm0_synthesize", on_delta=on_delta)
+    get = data.get
+    answer = get("answer", "")
+    key_points = get("key_points") or []
+    used_results = get("used_results") or []
+    notes = get("notes")
 
     return FinalAnswer(
         answer=answer,
@@ -379,35 +738,32 @@ Guidelines:
 - The text may be truncated, so work with what's available.
 - Remove any remaining duplicate content or boilerplate text.
 """.strip()
+_SYSTEM_MESSAGE_SUMMARIZE = {"role": "system", "content": LLM1_SYSTEM_PROMPT_SUMMARIZE}
 
 
-def call_llm1_summarize(
-    llm: JsonLLMClient,
-    question: str,
-    url: str,
-    title: str,
-    html_excerpt: str,  # Contains extracted text, not HTML
-) -> ArticleSummary:
+def _summarize_messages(question: str, url: str, title: str, html_excerpt: str) -> List[Dict[str, Any]]:
     payload = {
         "question": question,
         "url": url,
         "title": title,
         "extracted_text": html_excerpt,
     }
-    messages = [
-        {"role": "system", "content": LLM1_SYSTEM_PROMPT_SUMMARIZE},
+    return [
+        _SYSTEM_MESSAGE_SUMMARIZE,
         {
             "role": "user",
-            "content": json.dumps(payload, ensure_ascii=False),
+            "content": dumps(payload),
         },
     ]
-    data = llm.chat_json(messages, call_type="llm1_summarize")
 
-    clean_title = data.get("title") or title
-    summary_text = data.get("summary", "")
-    key_points = data.get("key_points") or []
-    relevance_score = float(data.get("relevance_score", 0.0))
-    notes = data.get("notes")
+
+def _parse_summary(data: Dict[str, Any], url: str, title: str) -> ArticleSummary:
+    get = data.get
+    clean_title = get("title") or title
+    summary_text = get("summary", "")
+    key_points = get("key_points") or []
+    relevance_score = float(get("relevance_score", 0.0))
+    notes = get("notes")
 
     # result_id is filled later by the orchestrator (we know which SearchResult it came from)
     return ArticleSummary(
@@ -419,3 +775,28 @@ def call_llm1_summarize(
         relevance_score=relevance_score,
         notes=notes,
     )
+
+
+def call_llm1_summarize(
+    llm: JsonLLMClient,
+    question: str,
+    url: str,
+    title: str,
+    html_excerpt: str,  # Contains extracted text, not HTML
+) -> ArticleSummary:
+    messages = _summarize_messages(question, url, title, html_excerpt[: llm.config.max_input_chars])
+    data = llm.chat_json(messages, call_type="llm1_summarize")
+    return _parse_summary(data, url, title)
+
+
+async def acall_llm1_summarize(
+    llm: JsonLLMClient,
+    question: str,
+    url: str,
+    title: str,
+    html_excerpt: str,  # Contains extracted text, not HTML
+) -> ArticleSummary:
+    """Async variant of `call_llm1_summarize`."""
+    messages = _summarize_messages(question, url, title, html_excerpt[: llm.config.max_input_chars])
+    data = await llm.achat_json(messages, call_type="llm1_summarize")
+    return _parse_summary(data, url, title)
@@ -0,0 +1,60 @@
+"""
+LLM Response Schemas
+Strict JSON schemas for each LLM call type, used with `response_format` json_schema mode.
+
+They mirror the JSON structures described in the system prompts in llm_client.
+Strict mode requires every property to be listed in `required`, so optional
+fields are expressed as nullable types instead.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+_STRING_LIST = {"type": "array", "items": {"type": "string"}}
+_NULLABLE_STRING = {"type": ["string", "null"]}
+
+
+def _object(**properties: Any) -> Dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+_SEARCH = _object(
+    query={"type": "string"},
+    when={"type": "string", "enum": ["day", "week", "month", "year", "any"]},
+    include=_STRING_LIST,
+    exclude=_STRING_LIST,
+    allow_domains=_STRING_LIST,
+    deny_domains=_STRING_LIST,
+    max_results={"type": "integer"},
+)
+
+RESPONSE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "llm0_plan": _object(
+        action={"type": "string", "enum": ["direct_answer", "search_then_answer"]},
+        direct_answer=_NULLABLE_STRING,
+        searches={"type": "array", "items": _SEARCH},
+        notes=_NULLABLE_STRING,
+    ),
+    "llm0_select": _object(
+        selected_ids=_STRING_LIST,
+        notes=_NULLABLE_STRING,
+    ),
+    "llm0_synthesize": _object(
+        answer={"type": "string"},
+        key_points=_STRING_LIST,
+        used_results=_STRING_LIST,
+        notes=_NULLABLE_STRING,
+    ),
+    "llm1_summarize": _object(
+        title=_NULLABLE_STRING,
+        summary={"type": "string"},
+        key_points=_STRING_LIST,
+        relevance_score={"type": "number"},
+        notes=_NULLABLE_STRING,
+    ),
+}
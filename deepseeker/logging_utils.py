@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 import logging
-from dataclasses import asdict, dataclass
+import threading
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, TextIO
 
+from .json_utils import dumps
 from .types import StepEvent
 
 
@@ -21,6 +22,146 @@ class LLMCallRecord:
     duration_ms: int
 
 
+class BatchingFileHandler(logging.Handler):
+    """
+    File handler that buffers formatted records and writes them in batches.
+
+    logging.FileHandler writes and flushes every record; this handler joins
+    buffered records into one write when `capacity` records are pending or
+    every `flush_interval` seconds (from a daemon thread), whichever is first.
+    logging.shutdown() at interpreter exit flushes whatever is left.
+    """
+
+    def __init__(
+        self,
+        filename: Path | str,
+        encoding: str = "utf-8",
+        capacity: int = 256,
+        flush_interval: float = 0.5,
+    ):
+        super().__init__()
+        self.capacity = capacity
+        self._stream = open(filename, "a", encoding=encoding)
+        self._buffer: List[str] = []
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name="deepseeker-log-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        # Handler.handle() already holds self.lock (an RLock) around emit()
+        self._buffer.append(msg)
+        if len(self._buffer) >= self.capacity:
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._buffer and not self._stream.closed:
+                self._stream.write("\n".join(self._buffer) + "\n")
+                self._stream.flush()
+                self._buffer.clear()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.flush()
+
+    def close(self) -> None:
+        self._stop.set()
+        self.flush()
+        with self.lock:
+            self._stream.close()
+        super().close()
+
+
+class _DetailFormatter(logging.Formatter):
+    """
+    Formatter for the detailed log that appends a record's `data` payload.
+
+    The payload travels unencoded on the record (`extra={"data": ...}`) and is
+    serialized here, i.e. only once a handler has accepted the record.
+
+    The date format has whole-second resolution (milliseconds come from
+    %(msecs)), so the formatted time is cached and strftime only runs when
+    the second changes.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (-1, "")  # (epoch second, formatted asctime)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second == cached_second:
+            return cached_text
+        text = super().formatTime(record, datefmt)
+        # Replaced as one tuple so concurrent handlers never see a torn pair
+        self._cached_time = (second, text)
+        return text
+
+    def format(self, record: logging.LogRecord) -> str:
+        msg = super().format(record)
+        data = getattr(record, "data", None)
+        if data:
+            msg += f" | data={dumps(data, default=str)}"
+        return msg
+
+
+def _json_array(items: List[str]) -> str:
+    """Join already-encoded JSON values into an array, one element per line."""
+    if not items:
+        return "[]"
+    return "[\n" + ",\n".join(items) + "\n]"
+
+
+# ---------- Console message formatters (one per step type) ----------
+
+
+def _console_search(message: str) -> str:
+    # Extract just the essential info
+    if "Running search" in message:
+        return message.partition(" with query=")[0] + "..."
+    return message
+
+
+def _console_select(message: str) -> str:
+    if "selected" in message:
+        return message
+    return "Selecting relevant results..."
+
+
+def _console_summarize(message: str) -> str:
+    if "Fetching" in message:
+        return "Reading article..."
+    if "summarized" in message:
+        return message.partition(" (relevance=")[0] + ")"
+    return "Summarizing..."
+
+
+def _console_final(message: str) -> str:
+    if "synthesizing" in message:
+        return "Synthesizing final answer..."
+    return message
+
+
+_CONSOLE_FORMATTERS: Dict[str, Callable[[str], str]] = {
+    "plan": lambda message: "Planning search strategy...",
+    "search": _console_search,
+    "select": _console_select,
+    "summarize": _console_summarize,
+    "final": _console_final,
+}
+
+
 class StepLogger:
     """
     Collects step events and optionally prints them to console.
@@ -30,6 +171,7 @@ class StepLogger:
     - File: Saves complete LLM I/O records and detailed logs
     - RAW STEP: Keeps console output minimal and clean
     - FULL LOG: Complete records saved to timestamped log files
+    - DEBUG: Full LLM inputs/outputs also streamed to an NDJSON file per call
     """
 
     def __init__(
@@ -42,7 +184,12 @@ class StepLogger:
         self.verbose = verbose
         self.debug = debug
         self.events: List[StepEvent] = []
+        self._event_lines: List[str] = []  # compact JSON of each event, in order
         self.llm_records: List[LLMCallRecord] = []
+        self._llm_record_lines: List[str] = []  # compact JSON of each LLM call, in order
+        # Batch planning logs from worker threads; keeps each list in step
+        # with its JSONL file
+        self._lock = threading.Lock()
         
         # Setup console logger for concise output
         self.logger = logger or logging.getLogger("deepseeker")
@@ -66,17 +213,40 @@ class StepLogger:
         # Set level based on debug flag
         self.file_logger.setLevel(logging.DEBUG if debug else logging.INFO)
         
-        # Remove existing handlers to avoid duplicates
+        # Remove existing handlers to avoid duplicates; a logger created in the
+        # same second shares this name, so close its handler (flush thread,
+        # buffered records, open file) rather than dropping it
+        for handler in self.file_logger.handlers:
+            handler.close()
         self.file_logger.handlers.clear()
         
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
-        file_formatter = logging.Formatter(
+        file_handler = BatchingFileHandler(self.log_file, encoding='utf-8')
+        file_formatter = _DetailFormatter(
             "%(asctime)s.%(msecs)03d | %(levelname)-8s | %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_formatter)
         self.file_logger.addHandler(file_handler)
 
+        # Step events are appended one JSON object per line as they happen,
+        # so the on-disk record grows in O(1) per step instead of being rewritten
+        self.steps_file = self.log_dir / f"deepseeker_steps_{timestamp}.jsonl"
+
+        # In debug mode full LLM inputs/outputs are also streamed to an NDJSON
+        # sidecar, one line per call, instead of only landing in save_full_log()
+        self.llm_calls_file = self.log_dir / f"deepseeker_llm_calls_{timestamp}.jsonl"
+
+        # Sidecar files are opened on their first line, so a session that
+        # never logs a step or LLM call holds no extra file handles
+        self._sidecars: Dict[Path, TextIO] = {}
+
+    def _append_line(self, path: Path, line: str) -> None:
+        """Append one line to a sidecar file, opening it on first use (caller holds _lock)."""
+        fh = self._sidecars.get(path)
+        if fh is None:
+            fh = self._sidecars[path] = open(path, "a", encoding="utf-8")
+        fh.write(line + "\n")
+
     def log(
         self,
         step_type: str,
@@ -91,7 +261,13 @@ class StepLogger:
             data=data or {},
             error=error,
         )
-        self.events.append(event)
+        # Events are not modified after logging, so encode each one exactly once
+        # and reuse the line for the JSONL file and save_full_log()
+        line = dumps(event, default=str)
+        with self._lock:
+            self.events.append(event)
+            self._event_lines.append(line)
+            self._append_line(self.steps_file, line)
 
         # Console output: Keep it concise (RAW STEP)
         if self.verbose:
@@ -102,10 +278,7 @@ class StepLogger:
 
         # File output: Detailed record
         log_level = logging.ERROR if error else logging.INFO
-        detailed_msg = f"[{step_type}] {message}"
-        if data:
-            detailed_msg += f" | data={json.dumps(data, ensure_ascii=False, default=str)}"
-        self.file_logger.log(log_level, detailed_msg)
+        self.file_logger.log(log_level, "[%s] %s", step_type, message, extra={"data": data})
 
     def log_llm_call(
         self,
@@ -124,15 +297,16 @@ class StepLogger:
             model=model,
             duration_ms=duration_ms,
         )
-        self.llm_records.append(record)
-        
-        # Always log basic call info
-        self.file_logger.info(f"LLM_CALL | {call_type} | {model} | {duration_ms}ms")
+        # Encoded once: the line goes to the debug sidecar and into save_full_log()
+        line = dumps(record, default=str)
+        with self._lock:
+            self.llm_records.append(record)
+            self._llm_record_lines.append(line)
+            if self.debug:
+                self._append_line(self.llm_calls_file, line)
         
-        # Only log detailed messages/responses if debug mode is enabled
-        if self.debug:
-            self.file_logger.debug(f"  Messages: {json.dumps(messages, ensure_ascii=False, indent=2)}")
-            self.file_logger.debug(f"  Response: {json.dumps(response, ensure_ascii=False, indent=2)}")
+        # The detailed log only notes the call; messages/responses are in the sidecar
+        self.file_logger.info("LLM_CALL | %s | %s | %dms", call_type, model, duration_ms)
 
     def _format_console_message(self, step_type: str, message: str, error: bool) -> str:
         """Format concise message for console output."""
@@ -140,51 +314,45 @@ class StepLogger:
             return f"ERROR [{step_type}] {message}"
         
         # Simplify common step types
-        if step_type == "plan":
-            return "Planning search strategy..."
-        elif step_type == "search":
-            # Extract just the essential info
-            if "Running search" in message:
-                return message.split(" with query=")[0] + "..."
-            elif "returned" in message and "results" in message:
-                return message
-            return message
-        elif step_type == "select":
-            if "selected" in message:
-                return message
-            return "Selecting relevant results..."
-        elif step_type == "summarize":
-            if "Fetching" in message:
-                return "Reading article..."
-            elif "summarized" in message:
-                return message.split(" (relevance=")[0] + ")"
-            return "Summarizing..."
-        elif step_type == "final":
-            if "synthesizing" in message:
-                return "Synthesizing final answer..."
-            return message
-        else:
+        formatter = _CONSOLE_FORMATTERS.get(step_type)
+        if formatter is None:
             return f"[{step_type}] {message}"
+        return formatter(message)
 
     def to_json(self) -> str:
         """Return all step events as JSON string."""
-        return json.dumps([asdict(e) for e in self.events], ensure_ascii=False, indent=2)
+        return dumps(self.events, indent=True, default=str)
 
     def save_full_log(self) -> str:
-        """Save complete log including LLM calls and return the file path."""
-        full_log = {
-            "metadata": {
-                "created_at": datetime.now().isoformat(),
-                "total_steps": len(self.events),
-                "total_llm_calls": len(self.llm_records),
-            },
-            "steps": [asdict(e) for e in self.events],
-            "llm_calls": [asdict(r) for r in self.llm_records],
+        """
+        Save complete log including LLM calls and return the file path.
+
+        The file is one JSON document with a record per line: step events and
+        LLM calls are spliced in from the lines already encoded by log() and
+        log_llm_call(), so nothing logged earlier is serialized again.
+        """
+        now = datetime.now()
+        metadata = {
+            "created_at": now.isoformat(),
+            "total_steps": len(self.events),
+            "total_llm_calls": len(self.llm_records),
         }
+        full_log = (
+            '{"metadata": ' + dumps(metadata)
+            + ',\n"steps": ' + _json_array(self._event_lines)
+            + ',\n"llm_calls": ' + _json_array(self._llm_record_lines)
+            + "}\n"
+        )
         
-        full_log_file = self.log_dir / f"deepseeker_full_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with self._lock:
+            for fh in self._sidecars.values():
+                fh.flush()
+        for handler in self.file_logger.handlers:
+            handler.flush()
+
+        full_log_file = self.log_dir / f"deepseeker_full_{now.strftime('%Y%m%d_%H%M%S')}.json"
         with open(full_log_file, 'w', encoding='utf-8') as f:
-            json.dump(full_log, f, ensure_ascii=False, indent=2)
+            f.write(full_log)
         
         return str(full_log_file)
 
@@ -195,8 +363,20 @@ class StepLogger:
             "total_llm_calls": len(self.llm_records),
             "errors": sum(1 for e in self.events if e.error),
             "log_file": str(self.log_file),
+            "steps_file": str(self.steps_file),
+            "llm_calls_file": str(self.llm_calls_file) if self.debug else None,
             "steps_by_type": {
                 step_type: sum(1 for e in self.events if e.step_type == step_type)
                 for step_type in set(e.step_type for e in self.events)
             }
         }
+
+    def close(self) -> None:
+        """Flush and close the JSONL sidecar files and the detailed log file."""
+        with self._lock:
+            for fh in self._sidecars.values():
+                fh.close()
+            self._sidecars.clear()
+        for handler in self.file_logger.handlers:
+            handler.close()
+        self.file_logger.handlers.clear()
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from .logging_utils import StepLogger
 from .llm_client import (
     JsonLLMClient,
+    acall_llm1_summarize,
     call_llm0_plan,
     call_llm0_select,
     call_llm0_synthesize,
-    call_llm1_summarize,
 )
-from .search_client import SearchClient
-from .types import ArticleSummary, DeepSeekerReport, SearchResult
+from .search_client import SearchClient, canonical_url
+from .types import ArticleSummary, DeepSeekerReport, SearchRequest, SearchResult
 
 
 class DeepSeekerOrchestrator:
@@ -25,11 +27,25 @@ class DeepSeekerOrchestrator:
         llm1: JsonLLMClient,
         search_client: SearchClient,
         logger: StepLogger,
+        summarize_concurrency: int = 8,
+        summarize_timeout: float = 60.0,
+        prefetch_top_k: int = 8,
+        search_concurrency: int = 4,
     ):
         self.llm0 = llm0
         self.llm1 = llm1
         self.search_client = search_client
         self.logger = logger
+        # Upper bound on LLM1 summarization requests in flight at once
+        self.summarize_concurrency = summarize_concurrency
+        # Seconds one LLM1 summary may take before it is dropped, so a single
+        # stalled request cannot hold up the whole gather
+        self.summarize_timeout = summarize_timeout
+        # Number of top-ranked results whose pages are fetched speculatively
+        # while LLM0 is still selecting; 0 disables prefetching
+        self.prefetch_top_k = prefetch_top_k
+        # Upper bound on planned searches sent to Bing at once
+        self.search_concurrency = search_concurrency
         
         # Ensure LLM clients have logger for full I/O recording
         if hasattr(llm0, 'logger'):
@@ -40,18 +56,47 @@ class DeepSeekerOrchestrator:
     def run(self, question: str) -> DeepSeekerReport:
         """
         Run the full pipeline for a single user question.
+
+        Synchronous wrapper around `run_async`. asyncio.run cannot nest, so
+        when called from a running event loop (Jupyter, async apps) the
+        pipeline runs on its own loop in a helper thread, blocking the caller
+        until it finishes; async callers should await `run_async` instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.run_async(question))
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self.run_async(question)).result()
+
+    async def run_async(self, question: str) -> DeepSeekerReport:
+        """
+        Async variant of `run`.
+
+        The LLM and search clients are blocking, so each call is dispatched
+        with `asyncio.to_thread`; this keeps the event loop free for callers
+        that drive several sessions (or other work) concurrently.
         """
         report = DeepSeekerReport(question=question, steps=[], final_answer=None)
+        try:
+            await self._run_pipeline(question, report)
+        finally:
+            # Snapshot the step log once, whichever step the pipeline ended on
+            report.steps = self.logger.events[:]
+            # The async clients' connections are bound to this event loop
+            await self.llm1.aclose()
+            await self.search_client.aclose()
+        return report
 
+    async def _run_pipeline(self, question: str, report: DeepSeekerReport) -> None:
         # ---------- Step 1: LLM0 decides plan ----------
         self.logger.log("plan", "LLM0 is planning: direct answer vs. search.")
-        plan = call_llm0_plan(self.llm0, question=question)
+        plan = await asyncio.to_thread(call_llm0_plan, self.llm0, question=question)
 
         if plan.action == "direct_answer" and plan.direct_answer:
             self.logger.log("final", "LLM0 decided to answer directly without search.")
             report.final_answer = self._wrap_direct_answer(plan.direct_answer)
-            report.steps = self.logger.events[:]
-            return report
+            return
 
         if plan.action != "search_then_answer" or not plan.search_requests:
             self.logger.log(
@@ -59,37 +104,59 @@ class DeepSeekerOrchestrator:
                 "LLM0 did not provide any search_requests. Aborting.",
                 error=True,
             )
-            report.steps = self.logger.events[:]
-            return report
+            return
 
         # ---------- Step 2: Run multiple searches ----------
         all_results: list[SearchResult] = []
-        for idx, sreq in enumerate(plan.search_requests, start=1):
-            self.logger.log(
-                "search",
-                f"Running search #{idx} with query='{sreq.query}' when='{sreq.when}'.",
-                data={"search_index": idx, "query": sreq.query, "when": sreq.when, "filters": sreq.filters.__dict__},
-            )
-            try:
-                partial = self.search_client.search(sreq)
-            except Exception as e:  # network / BingSift errors
+        # Filled alongside all_results so selection can resolve IDs directly
+        results_by_id: dict[str, SearchResult] = {}
+        # Searches often overlap; each page is only offered (and read) once
+        seen_urls: set[str] = set()
+        search_semaphore = asyncio.Semaphore(self.search_concurrency)
+
+        async def run_search(idx: int, sreq: SearchRequest) -> list[SearchResult] | Exception:
+            async with search_semaphore:
+                self.logger.log(
+                    "search",
+                    f"Running search #{idx} with query='{sreq.query}' when='{sreq.when}'.",
+                    data={"search_index": idx, "query": sreq.query, "when": sreq.when, "filters": sreq.filters.__dict__},
+                )
+                try:
+                    return await self.search_client.search_async(sreq)
+                except Exception as e:  # network / BingSift errors
+                    return e
+
+        # Searches are independent, so they run concurrently; results are
+        # merged in plan order afterwards to keep IDs and dedupe deterministic
+        outcomes = await asyncio.gather(
+            *(run_search(idx, sreq) for idx, sreq in enumerate(plan.search_requests, start=1))
+        )
+        for idx, (sreq, partial) in enumerate(zip(plan.search_requests, outcomes), start=1):
+            if isinstance(partial, Exception):
                 self.logger.log(
                     "error",
-                    f"Search #{idx} failed: {e}",
+                    f"Search #{idx} failed: {partial}",
                     error=True,
                     data={"search_index": idx, "query": sreq.query},
                 )
                 continue
 
             # Relabel IDs so they are unique across searches
+            kept = 0
             for r_index, r in enumerate(partial, start=1):
+                key = canonical_url(r.url)
+                if key in seen_urls:
+                    continue
+                seen_urls.add(key)
                 r.id = f"s{idx}_r{r_index}"
                 all_results.append(r)
+                results_by_id[r.id] = r
+                kept += 1
 
             self.logger.log(
                 "search",
-                f"Search #{idx} returned {len(partial)} results.",
-                data={"search_index": idx, "result_count": len(partial)},
+                f"Search #{idx} returned {len(partial)} results ({kept} new).",
+                data={"search_index": idx, "result_count": len(partial), "new_count": kept},
             )
 
         if not all_results:
@@ -98,8 +165,7 @@ class DeepSeekerOrchestrator:
                 "All searches failed or returned no results; aborting.",
                 error=True,
             )
-            report.steps = self.logger.events[:]
-            return report
+            return
 
         report.search_results = all_results
         self.logger.log(
@@ -108,65 +174,107 @@ class DeepSeekerOrchestrator:
             f"{len(plan.search_requests)} searches.",
         )
 
+        # One fetch per distinct URL, shared by every result that points at it
+        fetches: dict[str, asyncio.Future[str]] = {}
+
+        def fetch(url: str) -> asyncio.Future[str]:
+            task = fetches.get(url)
+            if task is None:
+                task = fetches[url] = asyncio.ensure_future(
+                    self.search_client.afetch_page_excerpt(url)
+                )
+            return task
+
         # ---------- Step 3: LLM0 selects which results to read ----------
+        # Start downloading the top-ranked pages now so their fetch latency
+        # overlaps the selection call; pages LLM0 skips are discarded below.
+        for r in all_results[: self.prefetch_top_k]:
+            fetch(r.url)
         self.logger.log("select", "LLM0 is selecting which results to read.")
-        selection = call_llm0_select(self.llm0, question=question, search_results=all_results)
+        selection = await asyncio.to_thread(
+            call_llm0_select, self.llm0, question=question, search_results=all_results
+        )
         self.logger.log(
             "select",
             f"LLM0 selected {len(selection.selected_ids)} results for deep reading.",
             data={"selected_ids": selection.selected_ids},
         )
 
-        selected_map = {r.id: r for r in all_results}
         read_targets: list[SearchResult] = [
-            selected_map[rid] for rid in selection.selected_ids if rid in selected_map
+            results_by_id[rid] for rid in selection.selected_ids if rid in results_by_id
         ]
 
+        selected_urls = {r.url for r in read_targets}
+        for url in [url for url in fetches if url not in selected_urls]:
+            task = fetches.pop(url)
+            if not task.cancel():
+                # Already finished: retrieve any error so asyncio does not report it
+                task.exception()
+
         if not read_targets:
             self.logger.log(
                 "final",
                 "LLM0 did not select any results to read; aborting.",
                 error=True,
             )
-            report.steps = self.logger.events[:]
-            return report
+            return
 
         # ---------- Step 4: LLM1 summarizes selected articles ----------
-        summaries: list[ArticleSummary] = []
-        for r in read_targets:
+        # Each article is its own fetch -> summarize pipeline, so a summary
+        # starts as soon as its page arrives instead of after the slowest fetch.
+        # LLM1 requests are bounded by a semaphore.
+        semaphore = asyncio.Semaphore(self.summarize_concurrency)
+
+        async def summarize(r: SearchResult) -> ArticleSummary | None:
             self.logger.log("summarize", f"Fetching and summarizing URL: {r.url}")
             try:
-                text_content = self.search_client.fetch_page_excerpt(r.url)
+                text_content = await fetch(r.url)
             except Exception as e:
                 self.logger.log(
                     "error",
                     f"Failed to fetch page for {r.url}: {e}",
                     error=True,
                 )
-                continue
+                return None
 
             try:
-                summary = call_llm1_summarize(
-                    llm=self.llm1,
-                    question=question,
-                    url=r.url,
-                    title=r.title,
-                    html_excerpt=text_content,  # Contains extracted text, not HTML
-                )
+                async with semaphore:
+                    summary = await asyncio.wait_for(
+                        acall_llm1_summarize(
+                            llm=self.llm1,
+                            question=question,
+                            url=r.url,
+                            title=r.title,
+                            html_excerpt=text_content,  # Contains extracted text, not HTML
+                        ),
+                        timeout=self.summarize_timeout,
+                    )
                 # Attach result_id
                 summary.result_id = r.id
-                summaries.append(summary)
                 self.logger.log(
                     "summarize",
                     f"LLM1 summarized {r.url} (relevance={summary.relevance_score:.2f}).",
                     data={"result_id": r.id},
                 )
+                return summary
+            except asyncio.TimeoutError:
+                self.logger.log(
+                    "error",
+                    f"LLM1 summarization timed out for {r.url} after {self.summarize_timeout:g}s.",
+                    error=True,
+                )
+                return None
             except Exception as e:
                 self.logger.log(
                     "error",
                     f"LLM1 summarization failed for {r.url}: {e}",
                     error=True,
                 )
+                return None
+
+        outcomes = await asyncio.gather(*(summarize(r) for r in read_targets))
+        # gather preserves input order, so summaries follow the selection order
+        summaries: list[ArticleSummary] = [s for s in outcomes if s is not None]
 
         report.raw_summaries = summaries
 
@@ -176,23 +284,21 @@ class DeepSeekerOrchestrator:
                 "No article summaries available; returning empty answer.",
                 error=True,
             )
-            report.steps = self.logger.events[:]
-            return report
+            return
 
         # ---------- Step 5: LLM0 synthesizes final answer ----------
         self.logger.log(
             "final",
             "LLM0 is synthesizing the final report from all summaries.",
         )
-        final_answer = call_llm0_synthesize(
+        final_answer = await asyncio.to_thread(
+            call_llm0_synthesize,
             llm=self.llm0,
             question=question,
             search_results=all_results,
             summaries=summaries,
         )
         report.final_answer = final_answer
-        report.steps = self.logger.events[:]
-        return report
 
     @staticmethod
     def _wrap_direct_answer(answer_text: str) -> "FinalAnswer":
@@ -204,14 +310,3 @@ class DeepSeekerOrchestrator:
             used_results=[],
             notes="Direct answer from LLM0 without web search.",
         )
-
-    @staticmethod
-    def _wrap_direct_answer(answer_text: str) -> "FinalAnswer":
-        from .types import FinalAnswer
-
-        return FinalAnswer(
-            answer=answer_text,
-            key_points=[],
-            used_results=[],
-            notes="Direct answer from LLM0 without web search.",
-        )
\ No newline at end of file
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from typing import Any, Hashable, List, Optional
 import asyncio
+import hashlib
+import math
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 
 from bingsift import filter_results  # type: ignore
 from bingsift.net import fetch_serp_by_query  # type: ignore
@@ -14,6 +25,104 @@ from .types import SearchFilters, SearchRequest, SearchResult
 from .text_extractor import extract_text_from_html
 
 
+# Browser-like headers for article fetches, installed once on the session
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-GB,en;q=0.9",
+    "Cache-Control": "no-cache",
+}
+
+# Query parameters that only track the click and never change the page
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid", "igshid"})
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalize a URL for duplicate detection.
+
+    Lowercases scheme and host, drops the fragment, a trailing slash and
+    tracking parameters (utm_* and common click IDs), and sorts the rest of
+    the query. Only used as a comparison key; the original URL is fetched.
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), "")
+    )
+
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _decode_html(body: bytes, encoding: Optional[str]) -> str:
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:  # unknown charset label from the server
+        return body.decode("utf-8", errors="replace")
+
+
+@lru_cache(maxsize=64)
+def _domain_set(domains: tuple[str, ...]) -> frozenset[str]:
+    """Normalize a domain filter list once per distinct list."""
+    return frozenset(
+        d.strip().lower().removeprefix("*.").strip(".") for d in domains if d.strip()
+    )
+
+
+def _domain_in(domain: Optional[str], domains: frozenset[str]) -> bool:
+    """True if `domain` or any parent domain of it is in `domains`."""
+    if not domain or not domains:
+        return False
+    labels = domain.lower().split(".")
+    return any(".".join(labels[i:]) in domains for i in range(len(labels)))
+
+
+def _excerpt_key(html: str, max_chars: int) -> tuple[bytes, int]:
+    """Cache key for an excerpt: a digest of the page, so the page itself is not kept."""
+    return hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest(), max_chars
+
+
+# SearchResult holds only flat scalars, so a shallow field copy matches asdict
+_SEARCH_RESULT_FIELDS = tuple(f.name for f in fields(SearchResult))
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+class _TTLCache:
+    """Small thread-safe LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if item[0] < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return item[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
 class SearchClient:
     """
     Thin wrapper on top of BingSift.
@@ -24,49 +133,98 @@ class SearchClient:
     - Fetch article HTML for LLM1.
     """
 
-    def __init__(self, timeout: int = 12):
+    def __init__(
+        self,
+        timeout: int = 12,
+        pool_size: int = 10,
+        extract_processes: int = 0,
+        max_html_bytes: int = 2 * 1024 * 1024,
+        search_cache_ttl: float = 300.0,
+        excerpt_cache_size: int = 256,
+    ):
         self.timeout = timeout
+        # Page bodies are streamed and cut off at this size; the excerpt only
+        # needs the first few KB of text, not multi-MB pages in full
+        self.max_html_bytes = max_html_bytes
+
+        # One pooled session per client so repeated page fetches reuse
+        # keep-alive connections instead of redoing DNS/TCP/TLS each time.
+        self.session = requests.Session()
+        self.session.headers.update(_DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Async counterpart for the orchestrator's article fetches. Its
+        # connections belong to the event loop that opened them, so it is
+        # created on first use and dropped again by aclose().
+        self.pool_size = pool_size
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+        # HTML parsing holds the GIL, so concurrent extractions in threads
+        # still run one at a time. With extract_processes > 0 the async path
+        # parses in a process pool instead (started on first use).
+        self.extract_processes = extract_processes
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
+
+        # SERPs and click-through targets are stable for minutes, so repeated
+        # queries within `search_cache_ttl` seconds skip the network; 0 disables
+        self._serp_cache: Optional[_TTLCache] = None
+        self._click_cache: Optional[_TTLCache] = None
+        if search_cache_ttl > 0:
+            self._serp_cache = _TTLCache(maxsize=256, ttl=search_cache_ttl)
+            self._click_cache = _TTLCache(maxsize=2048, ttl=search_cache_ttl)
+
+        # Extraction is deterministic, so a page seen again (retries, several
+        # results pointing at one page) reuses its excerpt; 0 disables
+        self._excerpt_cache: Optional[_TTLCache] = None
+        if excerpt_cache_size > 0:
+            self._excerpt_cache = _TTLCache(maxsize=excerpt_cache_size, ttl=math.inf)
 
     def search(self, req: SearchRequest) -> List[SearchResult]:
         """
         Run a Bing search using BingSift with optional filters.
+
+        Synchronous wrapper around `search_async`; must not be called from a
+        running event loop.
         """
-        # 1) Fetch SERP via BingSift
-        rows = fetch_serp_by_query(query=req.query, when=req.when, country="en-US")
+        return asyncio.run(self.search_async(req))
+
+    async def search_async(self, req: SearchRequest) -> List[SearchResult]:
+        """Async version of search."""
+        # 1) Fetch SERP via BingSift (blocking, so off the event loop)
+        rows = await self._fetch_serp(req.query, req.when)
 
         # 2) Apply filters if provided
         f: SearchFilters = req.filters
 
-        # BingSift filter_results supports include / exclude / allow_domains / deny_domains
-        if any(
-            [
-                f.include,
-                f.exclude,
-                f.allow_domains,
-                f.deny_domains,
-            ]
-        ):
+        # Keyword filters go through BingSift's filter_results
+        if f.include or f.exclude:
             rows = filter_results(
                 rows,
                 include=f.include or None,
                 exclude=f.exclude or None,
-                allow_domains=f.allow_domains or None,
-                deny_domains=f.deny_domains or None,
             )
 
+        # Domain filters are set lookups on each row's domain and its parents
+        if f.allow_domains or f.deny_domains:
+            allow = _domain_set(tuple(f.allow_domains))
+            deny = _domain_set(tuple(f.deny_domains))
+            rows = [
+                row for row in rows
+                if (not allow or _domain_in(row.get("domain"), allow))
+                and not _domain_in(row.get("domain"), deny)
+            ]
+
         # 3) Map to SearchResult and assign IDs r1, r2, ...
         results: List[SearchResult] = []
         rows = rows[: req.max_results]
-        
-        async def fetch_all_urls():
-            tasks = [
-                fetch_click_and_extract_async(row.get("url", ""))
-                for row in rows
-            ]
-            return await asyncio.gather(*tasks)
 
-        fetched_urls = asyncio.run(fetch_all_urls())
-        
+        # Resolve Bing click-through URLs concurrently; gather keeps row order
+        fetched_urls = await asyncio.gather(
+            *(self._resolve_click(row.get("url", "")) for row in rows)
+        )
+
         for idx, (real_url, row) in enumerate(zip(fetched_urls, rows), start=1):
             r = SearchResult(
                 id=f"r{idx}",
@@ -82,6 +240,30 @@ class SearchClient:
 
         return results
 
+    async def _fetch_serp(self, query: str, when: str) -> List[dict]:
+        key = (query, when)
+        if self._serp_cache is not None:
+            rows = self._serp_cache.get(key)
+            if rows is not None:
+                return rows
+        rows = await asyncio.to_thread(
+            fetch_serp_by_query, query=query, when=when, country="en-US"
+        )
+        # An empty page is more likely a transient block than a real answer
+        if rows and self._serp_cache is not None:
+            self._serp_cache.set(key, rows)
+        return rows
+
+    async def _resolve_click(self, url: str) -> str:
+        if self._click_cache is not None:
+            real_url = self._click_cache.get(url)
+            if real_url is not None:
+                return real_url
+        real_url = await fetch_click_and_extract_async(url)
+        if real_url and self._click_cache is not None:
+            self._click_cache.set(url, real_url)
+        return real_url
+
     def fetch_page_excerpt(
         self,
         url: str,
@@ -94,22 +276,103 @@ class SearchClient:
         raw HTML to the LLM, significantly reducing token usage while
         preserving the important information.
         """
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-GB,en;q=0.9",
-            "Cache-Control": "no-cache",
-        }
+        html = self.fetch_html(url)
 
-        resp = requests.get(url, timeout=self.timeout, headers=headers)
-        resp.raise_for_status()
-        html = resp.text
+        key = _excerpt_key(html, max_chars)
+        if self._excerpt_cache is not None:
+            extracted_text = self._excerpt_cache.get(key)
+            if extracted_text is not None:
+                return extracted_text
 
         # Extract text from HTML
         extracted_text = extract_text_from_html(html, max_chars=max_chars, use_importance=True)
+        if self._excerpt_cache is not None:
+            self._excerpt_cache.set(key, extracted_text)
         
         return extracted_text
 
+    def fetch_html(self, url: str) -> str:
+        """Download a page (up to max_html_bytes) and return its HTML."""
+        with self.session.get(url, timeout=self.timeout, stream=True) as resp:
+            resp.raise_for_status()
+            body = bytearray()
+            for chunk in resp.iter_content(_CHUNK_SIZE):
+                body += chunk
+                if len(body) >= self.max_html_bytes:
+                    break
+            return _decode_html(bytes(body[: self.max_html_bytes]), resp.encoding)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers=_DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                ),
+            )
+        return self._async_client
+
+    async def afetch_page_excerpt(
+        self,
+        url: str,
+        max_chars: int = 8000,
+    ) -> str:
+        """
+        Async version of fetch_page_excerpt over the shared AsyncClient pool.
+
+        Text extraction is CPU-bound, so it runs off the event loop: in the
+        process pool when extract_processes is set, otherwise in a thread.
+        """
+        html = await self.afetch_html(url)
+        key = _excerpt_key(html, max_chars)
+        if self._excerpt_cache is not None:
+            extracted_text = self._excerpt_cache.get(key)
+            if extracted_text is not None:
+                return extracted_text
+
+        extract = partial(extract_text_from_html, html, max_chars=max_chars, use_importance=True)
+        if self.extract_processes > 0:
+            if self._extract_pool is None:
+                self._extract_pool = ProcessPoolExecutor(max_workers=self.extract_processes)
+            extracted_text = await asyncio.get_running_loop().run_in_executor(self._extract_pool, extract)
+        else:
+            extracted_text = await asyncio.to_thread(extract)
+        if self._excerpt_cache is not None:
+            self._excerpt_cache.set(key, extracted_text)
+        return extracted_text
+
+    async def afetch_html(self, url: str) -> str:
+        """Async version of fetch_html."""
+        async with self._get_async_client().stream("GET", url) as resp:
+            resp.raise_for_status()
+            body = bytearray()
+            async for chunk in resp.aiter_bytes(_CHUNK_SIZE):
+                body += chunk
+                if len(body) >= self.max_html_bytes:
+                    break
+            return _decode_html(bytes(body[: self.max_html_bytes]), resp.encoding)
+
+    async def aclose(self) -> None:
+        """Close the async connection pool and stop the extraction process pool."""
+        if self._async_client is not None:
+            client, self._async_client = self._async_client, None
+            await client.aclose()
+        if self._extract_pool is not None:
+            pool, self._extract_pool = self._extract_pool, None
+            # Joining the worker processes blocks, so do it off the event loop
+            await asyncio.to_thread(pool.shutdown)
+
+    def close(self) -> None:
+        """Release the HTTP session and stop the extraction process pool."""
+        self.session.close()
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown()
+            self._extract_pool = None
+
     @staticmethod
     def to_dict_list(results: List[SearchResult]) -> List[dict]:
-        return [asdict(r) for r in results]
+        return [{name: getattr(r, name) for name in _SEARCH_RESULT_FIELDS} for r in results]
@@ -0,0 +1,159 @@
+"""
+Semantic Cache
+Reuses results for paraphrased inputs by comparing sentence embeddings.
+
+Requires the optional `sentence-transformers` package (and numpy), imported on
+first use: `pip install "deepseeker[semantic]"`.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, List, Optional
+
+from .json_utils import dumps, loads
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_SEMANTIC_CACHE_PATH = os.path.join("~", ".deepseeker", "semantic_cache.npz")
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache over normalized sentence embeddings.
+
+    A lookup returns the value stored for the most similar previous text when
+    the cosine similarity reaches `threshold`. Entries beyond `max_entries`
+    are evicted oldest first.
+
+    With a `path`, the index is loaded from that .npz file on first use and
+    rewritten after every add, so it carries over between processes; values
+    must then be JSON-serializable.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+    ):
+        self.threshold = threshold
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.path = os.path.expanduser(path) if path else None
+
+        self._model = None
+        self._matrix = None  # numpy array of shape (N, dim), rows are unit vectors
+        self._values: List[Any] = []
+        self._loaded = self.path is None
+        self._lock = threading.Lock()
+        self._model_lock = threading.Lock()
+
+    def warmup(self) -> threading.Thread:
+        """
+        Load the embedding model in a background daemon thread.
+
+        Importing sentence-transformers and loading the model takes on the
+        order of a second; starting it early overlaps that with other setup
+        instead of charging it to the first lookup.
+        """
+        thread = threading.Thread(target=self._warm, name="semantic-cache-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def _warm(self) -> None:
+        try:
+            self._get_model()
+        except Exception:
+            # Any real problem (e.g. missing package) resurfaces on first use
+            pass
+
+    def _get_model(self):
+        with self._model_lock:
+            if self._model is None:
+                try:
+                    from sentence_transformers import SentenceTransformer  # type: ignore
+                except ImportError as e:
+                    raise ImportError(
+                        "SemanticCache requires sentence-transformers: "
+                        "pip install \"deepseeker[semantic]\""
+                    ) from e
+                self._model = SentenceTransformer(self.model_name)
+            return self._model
+
+    def _encode(self, text: str):
+        return self._get_model().encode(text, normalize_embeddings=True)
+
+    def _load(self) -> None:
+        """Read the persisted index once (caller holds _lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.path):
+            return
+        import numpy as np
+
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                # Embeddings from another model are not comparable
+                if str(data["model"]) != self.model_name:
+                    return
+                matrix = data["matrix"]
+                values = loads(str(data["values"]))
+        except (OSError, KeyError, ValueError):
+            return  # unreadable or foreign file: start empty, overwritten on add
+        if len(values) == len(matrix) and len(values):
+            self._matrix = matrix
+            self._values = values
+
+    def _save(self) -> None:
+        """Rewrite the persisted index (caller holds _lock)."""
+        import numpy as np
+
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                model=np.array(self.model_name),
+                matrix=self._matrix,
+                values=np.array(dumps(self._values)),
+            )
+        os.replace(tmp_path, self.path)
+
+    def get(self, text: str) -> Optional[Any]:
+        """Return the value cached for the closest matching text, or None."""
+        with self._lock:
+            self._load()
+            if self._matrix is None:
+                return None
+        query = self._encode(text)
+        with self._lock:
+            sims = self._matrix @ query
+            idx = int(sims.argmax())
+            if sims[idx] >= self.threshold:
+                return self._values[idx]
+        return None
+
+    def add(self, text: str, value: Any) -> None:
+        """Store `value` under the embedding of `text`."""
+        import numpy as np
+
+        vector = self._encode(text)
+        with self._lock:
+            self._load()
+            if self._matrix is None:
+                self._matrix = vector[np.newaxis, :]
+            else:
+                self._matrix = np.vstack([self._matrix, vector])
+            self._values.append(value)
+
+            if len(self._values) > self.max_entries:
+                overflow = len(self._values) - self.max_entries
+                self._matrix = self._matrix[overflow:]
+                del self._values[:overflow]
+
+            if self.path is not None:
+                self._save()
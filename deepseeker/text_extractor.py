@@ -5,16 +5,76 @@ Extracts key text content from HTML, removing tags, scripts, styles, and other n
 from __future__ import annotations
 
 import re
+from collections import Counter
+from functools import lru_cache
 from html import unescape
 from typing import Optional
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser  # type: ignore
+except ImportError:  # optional C-backed parser; regex matching is the fallback
+    HTMLParser = None
+
 from .text_extraction_config import (
-    REMOVAL_PATTERNS,
+    COMBINED_REMOVAL_RE,
     IMPORTANT_TAGS,
     CONTENT_TAGS,
     MIN_RELEVANT_LENGTH
 )
 
+# Patterns used on every extraction, compiled once at import
+_TAG_RE = re.compile(r'<[^>]+>')
+# Scripts, styles and comments (with their content) and any other tag, in one pass
+_MARKUP_RE = re.compile(
+    r'<script[^>]*>.*?</script>|<style[^>]*>.*?</style>|<!--.*?-->|<[^>]+>',
+    re.DOTALL | re.IGNORECASE,
+)
+_SENTENCE_DELIMITER_RE = re.compile(r'[。！？.!?]+')
+_SENTENCE_ENDINGS = ('。', '.', '！', '!', '？', '?')
+
+# Text kept for cleanup, as a multiple of max_length. Noise removal and
+# dedupe rarely shrink text by more than this, so anything further into a
+# long page would be truncated away anyway and is not processed.
+_WORKING_TEXT_FACTOR = 4
+
+
+# Entities that make up nearly all escapes in page text, mapped as html.unescape does
+_COMMON_ENTITIES = {
+    '&amp;': '&',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&quot;': '"',
+    '&#39;': "'",
+    '&#x27;': "'",
+    '&apos;': "'",
+    '&nbsp;': '\xa0',
+}
+_COMMON_ENTITY_RE = re.compile('|'.join(map(re.escape, _COMMON_ENTITIES)))
+
+
+def _unescape(text: str) -> str:
+    """html.unescape with a table-lookup fast path for the common entities"""
+    if '&' not in text:
+        return text
+    replaced, count = _COMMON_ENTITY_RE.subn(lambda m: _COMMON_ENTITIES[m.group()], text)
+    # Only valid when every '&' was a common entity; otherwise unescaping the
+    # replaced text again would double-decode sequences such as '&amp;lt;'
+    if count == text.count('&'):
+        return replaced
+    return unescape(text)
+
+
+def _collapse_ws(text: str) -> str:
+    """Collapse whitespace runs to single spaces and strip the ends (no regex)"""
+    return ' '.join(text.split())
+
+
+@lru_cache(maxsize=None)
+def _tags_content_re(tags: tuple[str, ...]) -> re.Pattern[str]:
+    """Pattern capturing the content of any of `tags`, compiled once per tag list"""
+    names = '|'.join(map(re.escape, tags))
+    return re.compile(rf'<({names})\b[^>]*>(.*?)</\1>', re.DOTALL | re.IGNORECASE)
+
 
 class TextExtractor:
     """Tool class for extracting clean text from HTML content"""
@@ -35,28 +95,38 @@ class TextExtractor:
         if not html:
             return ""
         
-        # 1. Remove script and style tags with their content
-        html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r'<!--.*?-->', '', html, flags=re.DOTALL)
-        
-        # 2. Remove all tags but keep text between them
-        html = re.sub(r'<[^>]+>', ' ', html)
-        
-        # 3. Handle HTML entities
-        html = unescape(html)
+        if '<' not in html:
+            # Already plain text (e.g. a tool output): no markup to strip,
+            # only entities to decode
+            html = _unescape(html)
+        elif HTMLParser is not None:
+            # 1-3. Parse once; drop script/style/noscript subtrees and take the
+            # remaining text nodes (comments are skipped, entities decoded)
+            tree = HTMLParser(html)
+            tree.strip_tags(['script', 'style', 'noscript'])
+            html = tree.text(separator=' ')
+        else:
+            # 1-2. Remove scripts, styles and comments with their content, and
+            # all other tags while keeping the text between them
+            html = _MARKUP_RE.sub(' ', html)
+            
+            # 3. Handle HTML entities
+            html = _unescape(html)
         
         # 4. Clean whitespace
-        html = re.sub(r'\s+', ' ', html)
-        html = html.strip()
+        html = _collapse_ws(html)
+        
+        # Cap the working text before the cleanup passes
+        limit = self.max_length * _WORKING_TEXT_FACTOR
+        if len(html) > limit:
+            cut = html.rfind(' ', 0, limit)
+            html = html[:cut if cut > 0 else limit]
         
         # 5. Remove common noise patterns using config
-        for pattern in REMOVAL_PATTERNS:
-            html = re.sub(pattern, '', html, flags=re.IGNORECASE)
+        html = COMBINED_REMOVAL_RE.sub('', html)
         
         # 6. Clean up whitespace again
-        html = re.sub(r'\s+', ' ', html)
-        html = html.strip()
+        html = _collapse_ws(html)
         
         # 7. Remove duplicate sentences/words
         html = self._remove_duplicates(html)
@@ -79,41 +149,57 @@ class TextExtractor:
             Text with duplicates removed
         """
         # Split into sentences using multiple delimiters
-        sentence_delimiters = r'[。！？.!?]+'
-        sentences = [s.strip() for s in re.split(sentence_delimiters, text) if s.strip()]
+        sentences = [s.strip() for s in _SENTENCE_DELIMITER_RE.split(text) if s.strip()]
         
         if not sentences:
             return text
         
-        # Remove duplicates while preserving order
-        seen = set()
+        # Normalize for comparison: lowercase word sets
+        word_sets = [frozenset(sentence.lower().split()) for sentence in sentences]
+        
+        # Prefix filtering: with words in one global order (rarest first), two
+        # sets with Jaccard >= 0.8 must share a word within the first
+        # n - ceil(0.8 * n) + 1 words of each. Only kept sentences sharing such
+        # a prefix word are compared, instead of every kept sentence.
+        frequency = Counter(word for words in word_sets for word in words)
+        prefix_index: dict[str, list[int]] = {}
+        kept_sets: list[frozenset[str]] = []
+        kept_sizes: list[int] = []
         unique_sentences = []
         
-        for sentence in sentences:
-            # Normalize for comparison: lowercase, remove extra spaces
-            normalized = re.sub(r'\s+', ' ', sentence.lower()).strip()
+        for sentence, current_words in zip(sentences, word_sets):
+            if not current_words:
+                continue
+            size = len(current_words)
+            prefix = sorted(current_words, key=lambda w: (frequency[w], w))
+            prefix = prefix[:size - (4 * size + 4) // 5 + 1]
+            candidates = {i for word in prefix for i in prefix_index.get(word, ())}
             
             # Also check for near-duplicates (very similar sentences)
             is_duplicate = False
-            for existing in seen:
+            for i in candidates:
+                # Jaccard never exceeds min/max of the sizes, so skip pairs
+                # whose sizes alone rule out a match
+                existing_size = kept_sizes[i]
+                if 5 * min(size, existing_size) <= 4 * max(size, existing_size):
+                    continue
                 # If sentences share 80%+ of words, consider them duplicates
-                existing_words = set(existing.split())
-                current_words = set(normalized.split())
-                if len(existing_words) > 0 and len(current_words) > 0:
-                    intersection = existing_words.intersection(current_words)
-                    union = existing_words.union(current_words)
-                    similarity = len(intersection) / len(union)
-                    if similarity > 0.8:
-                        is_duplicate = True
-                        break
+                overlap = len(kept_sets[i] & current_words)
+                similarity = overlap / (existing_size + size - overlap)
+                if similarity > 0.8:
+                    is_duplicate = True
+                    break
             
-            if not is_duplicate and normalized:
-                seen.add(normalized)
+            if not is_duplicate:
+                for word in prefix:
+                    prefix_index.setdefault(word, []).append(len(kept_sets))
+                kept_sets.append(current_words)
+                kept_sizes.append(size)
                 unique_sentences.append(sentence)
         
         # Reconstruct text with proper punctuation
         result = '. '.join(unique_sentences)
-        if result and not result.endswith(('.', '。', '!', '！', '?', '？')):
+        if result and not result.endswith(_SENTENCE_ENDINGS):
             result += '.'
         
         return result
@@ -129,11 +215,10 @@ class TextExtractor:
         Returns:
             Truncation position
         """
-        # First try to truncate after punctuation marks
-        for punct in ['。', '.', '！', '!', '？', '?']:
-            last_punct = text.rfind(punct, 0, max_len)
-            if last_punct != -1 and last_punct > max_len - 100:
-                return last_punct + 1
+        # First try to truncate after the last punctuation mark
+        last_punct = max(text.rfind(punct, 0, max_len) for punct in _SENTENCE_ENDINGS)
+        if last_punct != -1 and last_punct > max_len - 100:
+            return last_punct + 1
         
         # If no punctuation found, try to truncate at space
         last_space = text.rfind(' ', 0, max_len)
@@ -165,18 +250,10 @@ class TextExtractor:
             important_tags = IMPORTANT_TAGS
         
         # First extract content from important tags
-        important_content = []
-        
-        for tag in important_tags:
-            # Match tags and their content
-            pattern = f'<{tag}[^>]*>(.*?)</{tag}>'
-            matches = re.findall(pattern, html, flags=re.DOTALL | re.IGNORECASE)
-            for match in matches:
-                # Clean content
-                cleaned = re.sub(r'<[^>]+>', ' ', match)
-                cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-                if cleaned:
-                    important_content.append(cleaned)
+        if HTMLParser is not None:
+            important_content = self._parse_important_content(html, important_tags)
+        else:
+            important_content = self._match_important_content(html, important_tags)
         
         # If important content found, return it
         if important_content:
@@ -199,15 +276,58 @@ class TextExtractor:
         # Fallback to full extraction
         return self.extract(html)
     
+    def _parse_important_content(self, html: str, important_tags: list[str]) -> list[str]:
+        """Collect important tag text with the selectolax parser, in document order"""
+        tree = HTMLParser(html)
+        # Embedded code is never article text, even inside <article>/<section>
+        tree.strip_tags(['script', 'style', 'noscript'])
+        tags = {tag.lower() for tag in important_tags}
+        important_content = []
+        remaining = self.max_length * _WORKING_TEXT_FACTOR
+        # One query for all tags; a node inside another important node is
+        # already part of that node's text, so it is not collected twice
+        for node in tree.css(', '.join(tags)):
+            parent = node.parent
+            while parent is not None and parent.tag not in tags:
+                parent = parent.parent
+            if parent is not None:
+                continue
+            cleaned = _collapse_ws(node.text(separator=' '))
+            if cleaned:
+                important_content.append(cleaned)
+                # Stop once there is more text than could survive truncation
+                remaining -= len(cleaned) + 1
+                if remaining <= 0:
+                    break
+        return important_content
+    
+    def _match_important_content(self, html: str, important_tags: list[str]) -> list[str]:
+        """Collect important tag text with regex matching (no parser installed)"""
+        important_content = []
+        remaining = self.max_length * _WORKING_TEXT_FACTOR
+        
+        # Match all tags and their content in one scan, in document order; an
+        # element nested in a matched one is covered by the outer match
+        for match in _tags_content_re(tuple(important_tags)).finditer(html):
+            # Clean content
+            cleaned = _TAG_RE.sub(' ', match.group(2))
+            cleaned = _collapse_ws(cleaned)
+            if cleaned:
+                important_content.append(cleaned)
+                # Stop once there is more text than could survive truncation
+                remaining -= len(cleaned) + 1
+                if remaining <= 0:
+                    break
+        return important_content
+    
     def _clean_text(self, text: str) -> str:
         """Clean text of extra whitespace and noise patterns"""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _collapse_ws(text)
         # Remove noise patterns using config
-        for pattern in REMOVAL_PATTERNS:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        text = COMBINED_REMOVAL_RE.sub('', text)
         # Clean whitespace again
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _collapse_ws(text)
         return text
 
 
@@ -34,7 +34,7 @@ class SearchRequest:
     max_results: int = 20
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """One search result row coming from BingSift."""
     id: str             # internal ID used inside DeepSeeker, e.g. "r1"